@@ -0,0 +1,128 @@
+import asyncio
+import inspect
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from test_management_tool import AutomatedTestCase, TestSuite
+
+# Workers per automation tool when no explicit limit is given
+DEFAULT_TOOL_LIMIT = 4
+
+
+# -----------------------------
+# Step 1: Async Suite Runner
+# -----------------------------
+class AsyncSuiteRunner:
+    # Runs the automated tests of a suite as coroutines. Every automation_tool
+    # gets its own bounded queue and its own fixed number of workers, e.g.
+    # {"Selenium": 4, "Playwright": 16}, so one tool's grid is never
+    # oversubscribed and a slow tool does not hold back the others. Producers
+    # wait when a tool's queue is full (backpressure), so only a bounded
+    # number of tests per tool are scheduled at any time.
+    def __init__(self, suite, tool_limits=None, default_limit=DEFAULT_TOOL_LIMIT,
+                 queue_size=None, timeout=None, writer=None):
+        self.suite = suite
+        self.tool_limits = tool_limits or {}
+        self.default_limit = default_limit
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.writer = writer
+        self._threads = None  # thread pool for plain callables, per run
+
+    def run(self):
+        asyncio.run(self.run_async())
+
+    async def run_async(self):
+        tools = [tool for tool, counts in self.suite.tool_status_counts.items()
+                 if tool != "NA" and sum(counts.values())]
+        limits = {tool: self.tool_limits.get(tool, self.default_limit) for tool in tools}
+        # Plain callables get their own threads, one per worker across all
+        # tools, so the loop's small default executor never caps a tool limit
+        self._threads = ThreadPoolExecutor(max_workers=max(1, sum(limits.values())))
+        try:
+            tasks = []
+            for tool, limit in limits.items():
+                queue = asyncio.Queue(maxsize=self.queue_size or 2 * limit)
+                tasks.append(self._produce(tool, queue, limit))
+                tasks.extend(self._consume(queue) for _ in range(limit))
+            await asyncio.gather(*tasks)
+        finally:
+            # Threads of timed-out tests cannot be stopped; do not wait for them
+            self._threads.shutdown(wait=False, cancel_futures=True)
+
+    async def _produce(self, tool, queue, limit):
+        for test in self.suite.query(automation_tool=tool):
+            # Tests with a result in the writer's file (resume) are skipped
+            if not self.suite._restore(test, self.writer) and test.test_func is not None:
+                await queue.put(test)
+        for _ in range(limit):
+            await queue.put(None)  # one stop marker per worker
+
+    async def _consume(self, queue):
+        while True:
+            test = await queue.get()
+            if test is None:
+                return
+            result = await self._run_test(test.test_func)
+            self.suite._record(test, result, self.writer)
+
+    async def _run_test(self, test_func):
+        # Coroutine functions run on the event loop; plain callables run in a
+        # thread of the runner's own pool so they do not block the other tests
+        try:
+            if inspect.iscoroutinefunction(test_func):
+                outcome = await asyncio.wait_for(test_func(), self.timeout)
+            else:
+                loop = asyncio.get_running_loop()
+                outcome = await asyncio.wait_for(
+                    loop.run_in_executor(self._threads, test_func), self.timeout)
+        except Exception:
+            return "Fail"
+        return "Fail" if outcome is False else "Pass"
+
+
+# -----------------------------
+# Step 2: Fake Tool for Local Runs
+# -----------------------------
+class FakeBrowserTool:
+    # Stands in for a Selenium grid / Playwright worker: each step just waits,
+    # and the tool records how many sessions were open at once
+    def __init__(self, name, latency=0.05, failure_rate=0.0, seed=None):
+        self.name = name
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.active = 0
+        self.peak = 0
+        self._random = random.Random(seed)
+
+    def make_test(self):
+        async def test_func():
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            try:
+                await asyncio.sleep(self.latency)
+                return self._random.random() >= self.failure_rate
+            finally:
+                self.active -= 1
+        return test_func
+
+
+# -----------------------------
+# Step 3: Main Program
+# -----------------------------
+if __name__ == "__main__":
+    selenium = FakeBrowserTool("Selenium", latency=0.2, failure_rate=0.1, seed=1)
+    playwright = FakeBrowserTool("Playwright", latency=0.05, failure_rate=0.1, seed=2)
+
+    suite = TestSuite("Async Regression Suite")
+    for i in range(40):
+        tool = selenium if i % 2 else playwright
+        suite.add_test(AutomatedTestCase(f"TC{i:03d}", f"Browser Test {i}", "Checkout",
+                                         tool.name, test_func=tool.make_test()))
+
+    runner = AsyncSuiteRunner(suite, tool_limits={"Selenium": 4, "Playwright": 16})
+    runner.run()
+
+    print(f"Peak Selenium sessions  : {selenium.peak}")
+    print(f"Peak Playwright sessions: {playwright.peak}")
+    suite.summary_report()
@@ -0,0 +1,57 @@
+# Benchmark: cost of TestSuite.summary_report on a 1M-test suite
+# Compares the old three-pass scan over test_cases with the live counters.
+#
+# Usage:
+#   python benchmark_summary.py [num_tests]
+
+import sys
+import time
+
+from test_management_tool import AutomatedTestCase, TestCase, TestSuite
+
+
+def scan_summary(test_cases):
+    # What summary_report did before the counters were added
+    total = len(test_cases)
+    passed = sum(1 for t in test_cases if t.status == "Pass")
+    failed = sum(1 for t in test_cases if t.status == "Fail")
+    not_executed = sum(1 for t in test_cases if t.status == "Not Executed")
+    return total, passed, failed, not_executed
+
+
+def build_suite(num_tests):
+    suite = TestSuite("Benchmark Suite")
+    modules = ["Authentication", "Cart", "Checkout", "Search"]
+    tools = ["Selenium", "Playwright"]
+    results = ["Pass", "Fail", "Not Executed"]
+    for i in range(num_tests):
+        if i % 2:
+            test = AutomatedTestCase(f"TC{i:07d}", f"Test {i}", modules[i % 4],
+                                     tools[i % 3 % 2])
+        else:
+            test = TestCase(f"TC{i:07d}", f"Test {i}", modules[i % 4])
+        suite.add_test(test)
+        test.execute_test(results[i % 3])
+    return suite
+
+
+def best_of(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    num_tests = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    suite = build_suite(num_tests)
+
+    before = best_of(lambda: scan_summary(suite.test_cases), repeat=3)
+    after = best_of(suite.summary_counts, repeat=1000)
+
+    print(f"Tests                  : {num_tests:,}")
+    print(f"Scan summary (before)  : {before * 1e3:10.3f} ms")
+    print(f"Live counters (after)  : {after * 1e3:10.6f} ms")
+    print(f"Speedup                : {before / after:,.0f}x")
@@ -0,0 +1,172 @@
+import argparse
+import csv
+import glob
+import os
+import sqlite3
+
+from test_management_tool import CSV_HEADER
+
+# Statuses that count as an actual execution in the analytics below
+EXECUTED = ("Pass", "Fail")
+
+
+# -----------------------------
+# Step 1: History Store
+# -----------------------------
+class ResultsHistory:
+    # Append-only SQLite store of many test_results.csv runs. Each ingested
+    # file becomes one run (numbered in ingestion order); results are keyed by
+    # (Test ID, run) and test metadata is stored once per test. The analytics
+    # are single aggregate queries, so no CSV is re-parsed per question.
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id      INTEGER PRIMARY KEY,
+                source      TEXT UNIQUE NOT NULL,
+                ingested_at TEXT DEFAULT CURRENT_TIMESTAMP
+            );
+            CREATE TABLE IF NOT EXISTS tests (
+                test_id         TEXT PRIMARY KEY,
+                test_name       TEXT,
+                module          TEXT,
+                automation_tool TEXT
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS results (
+                test_id TEXT NOT NULL,
+                run_id  INTEGER NOT NULL,
+                status  TEXT NOT NULL,
+                PRIMARY KEY (test_id, run_id)
+            ) WITHOUT ROWID;
+        """)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def ingest(self, csv_paths):
+        # Files are loaded oldest first so run order follows the runs
+        # themselves; files already in the store are skipped
+        paths = sorted(csv_paths, key=lambda p: (os.path.getmtime(p), p))
+        ingested = []
+        for path in paths:
+            run_id = self.ingest_file(path)
+            if run_id is not None:
+                ingested.append(run_id)
+        return ingested
+
+    def ingest_file(self, csv_path):
+        source = os.path.abspath(csv_path)
+        with self.conn:
+            if self.conn.execute("SELECT 1 FROM runs WHERE source = ?",
+                                 (source,)).fetchone():
+                return None
+            run_id = self.conn.execute(
+                "INSERT INTO runs (source) VALUES (?)", (source,)).lastrowid
+            with open(csv_path, mode='r', newline='') as file:
+                reader = csv.reader(file)
+                if next(reader, None) != CSV_HEADER:
+                    raise ValueError(f"{csv_path} is not a test results CSV")
+                rows = [row for row in reader if len(row) == len(CSV_HEADER)]
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO tests VALUES (?, ?, ?, ?)",
+                ((r[0], r[1], r[2], r[4]) for r in rows))
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                ((r[0], run_id, r[3]) for r in rows))
+        return run_id
+
+    # -----------------------------
+    # Step 2: Analytics
+    # -----------------------------
+    def run_count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    def pass_rates(self, min_runs=1):
+        # (test_id, executed runs, passes, pass rate), worst first
+        return self.conn.execute("""
+            SELECT test_id, COUNT(*), SUM(status = 'Pass'),
+                   AVG(status = 'Pass') AS rate
+            FROM results
+            WHERE status IN (?, ?)
+            GROUP BY test_id
+            HAVING COUNT(*) >= ?
+            ORDER BY rate, test_id
+        """, (*EXECUTED, min_runs)).fetchall()
+
+    def flakiness(self, min_runs=2):
+        # Flakiness score = Pass/Fail flips between consecutive executed runs
+        # divided by the number of possible flips; 0 is stable, 1 flips every run
+        return self.conn.execute("""
+            SELECT test_id, COUNT(*), SUM(flip),
+                   CAST(SUM(flip) AS REAL) / (COUNT(*) - 1) AS score
+            FROM (
+                SELECT test_id,
+                       status != LAG(status) OVER (
+                           PARTITION BY test_id ORDER BY run_id) AS flip
+                FROM results
+                WHERE status IN (?, ?)
+            )
+            GROUP BY test_id
+            HAVING COUNT(*) >= MAX(?, 2)
+            ORDER BY score DESC, test_id
+        """, (*EXECUTED, min_runs)).fetchall()
+
+    def first_failing_runs(self):
+        # (test_id, run_id, source file) of each test's first failure
+        return self.conn.execute("""
+            SELECT f.test_id, f.run_id, runs.source
+            FROM (SELECT test_id, MIN(run_id) AS run_id
+                  FROM results WHERE status = 'Fail'
+                  GROUP BY test_id) AS f
+            JOIN runs USING (run_id)
+            ORDER BY f.run_id, f.test_id
+        """).fetchall()
+
+    def test_history(self, test_id):
+        return self.conn.execute("""
+            SELECT run_id, status FROM results
+            WHERE test_id = ? ORDER BY run_id
+        """, (test_id,)).fetchall()
+
+
+# -----------------------------
+# Step 3: Main Program
+# -----------------------------
+def main():
+    parser = argparse.ArgumentParser(
+        description="Load test_results.csv runs into a history store and report on them.")
+    parser.add_argument("--db", default="results_history.db", help="SQLite history file")
+    parser.add_argument("--ingest", nargs="*", default=[],
+                        help="Result CSV files or glob patterns to add as runs")
+    parser.add_argument("--top", type=int, default=10, help="Rows to show per report")
+    args = parser.parse_args()
+
+    paths = [p for pattern in args.ingest for p in sorted(glob.glob(pattern))]
+    with ResultsHistory(args.db) as history:
+        added = history.ingest(paths)
+        print(f"Ingested {len(added)} new run(s); {history.run_count()} run(s) stored")
+
+        print("\n--- Lowest Pass Rates ---")
+        for test_id, runs, passes, rate in history.pass_rates()[:args.top]:
+            print(f"{test_id}: {passes}/{runs} passed ({rate:.0%})")
+
+        print("\n--- Flakiest Tests ---")
+        for test_id, runs, flips, score in history.flakiness()[:args.top]:
+            print(f"{test_id}: {flips} flip(s) over {runs} runs (score {score:.2f})")
+
+        print("\n--- First Failing Run ---")
+        for test_id, run_id, source in history.first_failing_runs()[:args.top]:
+            print(f"{test_id}: run {run_id} ({source})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,179 @@
 import csv
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+import time
+from array import array
+from collections import Counter, defaultdict
+from collections.abc import Sequence
+from multiprocessing.connection import wait as wait_for_connections
+
+# Executors available to TestSuite.run_all_tests in non-interactive mode
+EXECUTORS = ("thread", "process")
+
+# Column layout shared by save_results_to_csv and ResultWriter
+CSV_HEADER = ["Test ID", "Test Name", "Module", "Status", "Automation Tool"]
+
+
+# -----------------------------
+# Step 0: Test Callable Runner
+# -----------------------------
+def run_test_func(test_func):
+    # Runs inside a worker: an exception (including SystemExit and other
+    # BaseExceptions, but not Ctrl+C) or a False return is a failure,
+    # anything else (None, True, ...) is a pass
+    try:
+        outcome = test_func()
+    except KeyboardInterrupt:
+        raise
+    except BaseException:
+        return "Fail"
+    return "Fail" if outcome is False else "Pass"
+
+
+def _process_worker(conn):
+    # Child side of a TestProcess: run each test_func received, send back
+    # its result; None or a closed pipe ends the process
+    while True:
+        try:
+            test_func = conn.recv()
+        except EOFError:
+            return
+        if test_func is None:
+            return
+        conn.send(run_test_func(test_func))
+
+
+class TestThread:
+    # One daemon thread that runs one test at a time and reports
+    # (self, result) on a queue shared by all workers. A thread cannot be
+    # stopped, so a test that overruns its deadline is abandoned: the thread
+    # finishes it on its own (the late result is ignored) and exits, and a
+    # fresh TestThread takes the slot. Being a daemon, it never holds up
+    # interpreter exit.
+    def __init__(self, results):
+        self.test = None
+        self.deadline = None
+        self._results = results
+        self._inbox = queue.SimpleQueue()
+        threading.Thread(target=self._loop, daemon=True).start()
+
+    def _loop(self):
+        while True:
+            test_func = self._inbox.get()
+            if test_func is None:
+                return
+            self._results.put((self, run_test_func(test_func)))
+
+    def start(self, test, timeout):
+        self._inbox.put(test.test_func)
+        self.test = test
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        return True
+
+    def finish(self, result):
+        test, self.test, self.deadline = self.test, None, None
+        return test, result
+
+    def abandon(self):
+        # Gives up on a hung test: (test, "Fail"); the thread exits once the
+        # test returns
+        test, self.test, self.deadline = self.test, None, None
+        self.close()
+        return test, "Fail"
+
+    def close(self):
+        self._inbox.put(None)
+
+
+class TestProcess:
+    # One worker process that runs one test at a time. The test starts the
+    # moment it is sent (the worker is idle), so its deadline is exact; a
+    # test that overruns it is stopped by terminating the process, which is
+    # replaced by a fresh one so the slot is free again right away.
+    def __init__(self):
+        self.test = None
+        self.deadline = None
+        self._spawn()
+
+    def _spawn(self):
+        self.conn, child = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_process_worker,
+                                               args=(child,), daemon=True)
+        self.process.start()
+        child.close()
+
+    def start(self, test, timeout):
+        # False if test_func cannot be sent to the worker (e.g. a lambda or a
+        # closure, which do not pickle); nothing is sent then
+        try:
+            self.conn.send(test.test_func)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return False
+        self.test = test
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        return True
+
+    def finish(self):
+        # (test, result) once the worker has answered; a worker that died
+        # mid-test counts as a failure and is replaced
+        try:
+            result = self.conn.recv()
+        except EOFError:
+            result = "Fail"
+            self.restart()
+        test, self.test, self.deadline = self.test, None, None
+        return test, result
+
+    def kill(self):
+        # Stops a hung test: (test, "Fail") and a fresh worker in its place
+        test, self.test, self.deadline = self.test, None, None
+        self.restart()
+        return test, "Fail"
+
+    def restart(self):
+        self.process.terminate()
+        self.process.join()
+        self.conn.close()
+        self._spawn()
+
+    def close(self):
+        if self.test is None:
+            self.conn.send(None)
+        else:
+            self.process.terminate()
+        self.process.join()
+        self.conn.close()
+
 
 # -----------------------------
 # Step 1: TestCase Class
 # -----------------------------
 class TestCase:
-    def __init__(self, test_id, test_name, module, status="Not Executed"):
+    def __init__(self, test_id, test_name, module, status="Not Executed",
+                 test_func=None):
         self.test_id = test_id
         self.test_name = test_name
         self.module = module
+        # Suites holding this test; they are told about every status change
+        self._suites = []
         self.status = status
+        # Optional callable used by the parallel executor mode
+        # (must be a picklable module-level function for the process pool)
+        self.test_func = test_func
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, value):
+        old = getattr(self, "_status", None)
+        self._status = value
+        for suite in self._suites:
+            suite._status_changed(self, old, value)
 
     def execute_test(self, result):
         self.status = result
@@ -25,8 +190,9 @@ class TestCase:
 # Step 2: AutomatedTestCase Class
 # -----------------------------
 class AutomatedTestCase(TestCase):
-    def __init__(self, test_id, test_name, module, automation_tool, status="Not Executed"):
-        super().__init__(test_id, test_name, module, status)
+    def __init__(self, test_id, test_name, module, automation_tool,
+                 status="Not Executed", test_func=None):
+        super().__init__(test_id, test_name, module, status, test_func)
         self.automation_tool = automation_tool
 
     def display_test_case(self):
@@ -39,44 +205,642 @@ class AutomatedTestCase(TestCase):
                 self.status, self.automation_tool]
 
 
+# -----------------------------
+# Step 2b: Secondary Row Index
+# -----------------------------
+def tool_of(test_case):
+    # Manual tests have no automation_tool; they are grouped under "NA"
+    return getattr(test_case, "automation_tool", "NA")
+
+
+# Test case fields that TestSuite.query can look up through an index
+INDEXED_FIELDS = {
+    "module": lambda t: t.module,
+    "status": lambda t: t.status,
+    "automation_tool": tool_of,
+}
+
+
+class RowIndex:
+    # Maps a field value to the rows (positions in the suite) holding it,
+    # stored as compact arrays in insertion order. When a row's value changes
+    # it is appended to the new bucket and its old entry is left behind as
+    # stale; readers re-check the current value while a bucket has stale
+    # entries, and it is rebuilt once half of it is stale. This keeps updates
+    # amortized O(1) without per-row objects.
+    def __init__(self):
+        self.buckets = {}
+        self.stale = Counter()
+
+    def add(self, value, row):
+        bucket = self.buckets.get(value)
+        if bucket is None:
+            bucket = self.buckets[value] = array("I")
+        bucket.append(row)
+
+    def move(self, row, old, new, current):
+        self.add(new, row)
+        self.stale[old] += 1
+        bucket = self.buckets.get(old)
+        if bucket is not None and self.stale[old] * 2 > len(bucket):
+            self.buckets[old] = array(
+                "I", sorted({r for r in bucket if current(r) == old}))
+            self.stale[old] = 0
+
+    def rows(self, value):
+        return self.buckets.get(value, ())
+
+
 # -----------------------------
 # Step 3: TestSuite Class
 # -----------------------------
 class TestSuite:
     def __init__(self, suite_name):
         self.suite_name = suite_name
+        # Live counters kept up to date by add_test and status changes, so
+        # summaries never have to scan test_cases
+        self.status_counts = Counter()
+        self.module_status_counts = defaultdict(Counter)
+        self.tool_status_counts = defaultdict(Counter)
+        # Indexes behind get_test and query, also kept current on every change
+        self._id_index = {}
+        self._indexes = {field: RowIndex() for field in INDEXED_FIELDS}
         self.test_cases = []
 
     def add_test(self, test_case):
+        # Returns the object the suite tracks: here test_case itself
+        if test_case.test_id in self._id_index:
+            raise ValueError(f"Duplicate test ID '{test_case.test_id}'")
+        self._id_index[test_case.test_id] = len(self.test_cases)
         self.test_cases.append(test_case)
+        test_case._suites.append(self)
+        self._added(self._id_index[test_case.test_id], test_case)
+        return test_case
+
+    def _added(self, row, test_case):
+        for field, value_of in INDEXED_FIELDS.items():
+            self._indexes[field].add(value_of(test_case), row)
+        self._count(test_case, test_case.status, 1)
+
+    def _row_of(self, test_case):
+        return self._id_index[test_case.test_id]
+
+    def _status_changed(self, test_case, old, new):
+        self._count(test_case, old, -1)
+        self._count(test_case, new, 1)
+        self._indexes["status"].move(self._row_of(test_case), old, new,
+                                     self._status_at)
 
-    def run_all_tests(self):
+    def _status_at(self, row):
+        return self.test_cases[row].status
+
+    def _count(self, test_case, status, delta):
+        tool = tool_of(test_case)
+        self.status_counts[status] += delta
+        self.module_status_counts[test_case.module][status] += delta
+        self.tool_status_counts[tool][status] += delta
+
+    def get_test(self, test_id):
+        row = self._id_index.get(test_id)
+        return None if row is None else self.test_cases[row]
+
+    def query_rows(self, module=None, status=None, automation_tool=None):
+        # Walks only the smallest matching index bucket and checks the other
+        # fields on each of its rows, so a query costs O(smallest bucket),
+        # not O(suite) or O(sum of the buckets)
+        criteria = {field: value for field, value in
+                    (("module", module), ("status", status),
+                     ("automation_tool", automation_tool))
+                    if value is not None}
+        if not criteria:
+            return list(range(len(self.test_cases)))
+        field, value = min(criteria.items(),
+                           key=lambda item: len(self._indexes[item[0]].rows(item[1])))
+        index = self._indexes[field]
+        stale = index.stale[value]
+        # The walked bucket's own field only needs checking while it has
+        # stale entries (which may also repeat a row)
+        checks = [self._matcher(f, v) for f, v in criteria.items()
+                  if f != field or stale]
+        rows = [row for row in index.rows(value)
+                if all(check(row) for check in checks)]
+        return sorted(set(rows) if stale else rows)
+
+    def _matcher(self, field, value):
+        # Predicate: does the test at a row have this value for field?
+        value_of = INDEXED_FIELDS[field]
+        test_cases = self.test_cases
+        return lambda row: value_of(test_cases[row]) == value
+
+    def query(self, module=None, status=None, automation_tool=None):
+        test_cases = self.test_cases
+        return [test_cases[row]
+                for row in self.query_rows(module, status, automation_tool)]
+
+    def run_all_tests(self, executor=None, max_workers=None, timeout=None,
+                      writer=None):
         print(f"\nExecuting Test Suite: {self.suite_name}\n")
-        for test in self.test_cases:
+        if executor is not None:
+            self.run_parallel(executor, max_workers, timeout, writer)
+            return
+        for test in self._pending_tests(writer):
             test.display_test_case()
             result = input("Enter result (Pass/Fail): ")
-            test.execute_test(result)
+            self._record(test, result, writer)
+
+    def run_parallel(self, executor="thread", max_workers=None, timeout=None,
+                     writer=None):
+        # Non-interactive mode: every test with a test_func is dispatched to a
+        # thread or process pool and its result is recorded as soon as it
+        # completes. Tests without a callable stay "Not Executed".
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor '{executor}', "
+                             f"expected one of {sorted(EXECUTORS)}")
+        workers = max_workers or os.cpu_count() or 1
+        pending = (t for t in self._pending_tests(writer)
+                   if t.test_func is not None)
+        if executor == "process":
+            self._run_in_processes(pending, workers, timeout, writer)
+        else:
+            self._run_in_threads(pending, workers, timeout, writer)
+
+    def _run_in_threads(self, pending, workers, timeout, writer):
+        # Each worker thread takes one test at a time, so its deadline starts
+        # when it is handed out; a test past its deadline is recorded as Fail
+        # and its thread is abandoned and replaced, so a hung test never
+        # holds one of the max_workers slots
+        results = queue.SimpleQueue()
+        threads = [TestThread(results) for _ in range(workers)]
+        try:
+            while True:
+                self._fill(threads, pending, timeout, writer)
+                busy = [thread for thread in threads if thread.test is not None]
+                if not busy:
+                    break
+
+                try:
+                    finished = [results.get(timeout=self._wakeup(busy))]
+                    while not results.empty():
+                        finished.append(results.get())
+                except queue.Empty:
+                    finished = []
+                for thread, result in finished:
+                    # Late results of abandoned threads are dropped
+                    if thread.test is not None:
+                        self._record(*thread.finish(result), writer)
+
+                now = time.monotonic()
+                for i, thread in enumerate(threads):
+                    if thread.deadline is not None and now >= thread.deadline:
+                        self._record(*thread.abandon(), writer)
+                        threads[i] = TestThread(results)
+        finally:
+            for thread in threads:
+                thread.close()
+
+    def _run_in_processes(self, pending, workers, timeout, writer):
+        # Each worker process takes one test at a time; a test past its
+        # deadline is killed together with its worker, which is replaced
+        procs = [TestProcess() for _ in range(workers)]
+        try:
+            while True:
+                self._fill(procs, pending, timeout, writer)
+                busy = [proc for proc in procs if proc.test is not None]
+                if not busy:
+                    break
+
+                ready = wait_for_connections([proc.conn for proc in busy], self._wakeup(busy))
+                now = time.monotonic()
+                for proc in busy:
+                    if proc.conn in ready:
+                        self._record(*proc.finish(), writer)
+                    elif proc.deadline is not None and now >= proc.deadline:
+                        self._record(*proc.kill(), writer)
+        finally:
+            for proc in procs:
+                proc.close()
+
+    def _pending_tests(self, writer):
+        # In resume mode, tests the results file already has a result for are
+        # skipped and get that result back, so summaries cover the whole run
+        if writer is None or not writer.recorded_results:
+            return iter(self.test_cases)
+        return (t for t in self.test_cases if not self._restore(t, writer))
+
+    @staticmethod
+    def _restore(test, writer):
+        # True (and the recorded status set) if the writer already holds a
+        # result for this test
+        status = writer.recorded_results.get(test.test_id) if writer is not None else None
+        if status is None:
+            return False
+        if test.status != status:
+            test.execute_test(status)
+        return True
+
+    @staticmethod
+    def _record(test, result, writer):
+        test.execute_test(result)
+        if writer is not None:
+            writer.write(test)
+
+    def _fill(self, workers, pending, timeout, writer):
+        # Hands the next pending tests to idle workers; a test a worker
+        # cannot take (TestProcess with an unpicklable test_func) fails
+        for worker in workers:
+            while worker.test is None:
+                test = next(pending, None)
+                if test is None:
+                    return
+                if not worker.start(test, timeout):
+                    self._record(test, "Fail", writer)
+
+    @staticmethod
+    def _wakeup(busy):
+        # Seconds until the earliest deadline among busy workers (None: no deadline)
+        deadlines = [worker.deadline for worker in busy if worker.deadline is not None]
+        return max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
 
     def save_results_to_csv(self, file_name):
         with open(file_name, mode='w', newline='') as file:
             writer = csv.writer(file)
-            writer.writerow(
-                ["Test ID", "Test Name", "Module", "Status", "Automation Tool"]
-            )
+            writer.writerow(CSV_HEADER)
             for test in self.test_cases:
                 writer.writerow(test.to_csv_row())
 
+    def summary_counts(self, module=None, automation_tool=None):
+        # Constant-time in the number of tests: reads the live counters
+        if module is not None and automation_tool is not None:
+            raise ValueError("Pass either module or automation_tool, not both")
+        if module is not None:
+            counts = self.module_status_counts.get(module, Counter())
+        elif automation_tool is not None:
+            counts = self.tool_status_counts.get(automation_tool, Counter())
+        else:
+            counts = self.status_counts
+        summary = {"Total": sum(counts.values())}
+        for status in ("Pass", "Fail", "Not Executed"):
+            summary[status] = counts[status]
+        for status, count in counts.items():
+            if status not in summary and count:
+                summary[status] = count
+        return summary
+
     def summary_report(self):
-        total = len(self.test_cases)
-        passed = sum(1 for t in self.test_cases if t.status == "Pass")
-        failed = sum(1 for t in self.test_cases if t.status == "Fail")
-        not_executed = sum(1 for t in self.test_cases if t.status == "Not Executed")
+        summary = self.summary_counts()
 
         print("\n--- Test Execution Summary ---")
-        print(f"Total Tests       : {total}")
-        print(f"Passed Tests      : {passed}")
-        print(f"Failed Tests      : {failed}")
-        print(f"Not Executed Tests: {not_executed}")
+        print(f"Total Tests       : {summary.pop('Total')}")
+        print(f"Passed Tests      : {summary.pop('Pass')}")
+        print(f"Failed Tests      : {summary.pop('Fail')}")
+        print(f"Not Executed Tests: {summary.pop('Not Executed')}")
+        for status, count in summary.items():
+            print(f"{status + ' Tests':<18}: {count}")
+
+
+# -----------------------------
+# Step 3b: Columnar TestSuite Backend
+# -----------------------------
+class StringTable:
+    # Interns repeated strings (modules, tools, statuses) as small int codes
+    def __init__(self, *initial):
+        self.codes = {}
+        self.values = []
+        for value in initial:
+            self.code(value)
+
+    def code(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class StringColumn:
+    # Mostly-unique strings (ids, names) packed into one UTF-8 buffer with an
+    # end-offset array, instead of one Python str object per row
+    def __init__(self):
+        self._data = bytearray()
+        self._ends = array("Q")
+
+    def __len__(self):
+        return len(self._ends)
+
+    def __getitem__(self, row):
+        start = self._ends[row - 1] if row else 0
+        return self._data[start:self._ends[row]].decode()
+
+    def append(self, value):
+        self._data += value.encode()
+        self._ends.append(len(self._data))
+
+
+class TestCaseRow:
+    # Lightweight view of one row of a ColumnarTestSuite. It offers the same
+    # API as TestCase/AutomatedTestCase but holds no data of its own.
+    __slots__ = ("_suite", "_row")
+
+    def __init__(self, suite, row):
+        self._suite = suite
+        self._row = row
+
+    @property
+    def test_id(self):
+        return self._suite._ids[self._row]
+
+    @property
+    def test_name(self):
+        return self._suite._names[self._row]
+
+    @property
+    def module(self):
+        suite = self._suite
+        return suite._modules.values[suite._module_codes[self._row]]
+
+    @property
+    def automation_tool(self):
+        # Manual rows behave like TestCase, which has no automation_tool
+        code = self._suite._tool_codes[self._row]
+        if code == ColumnarTestSuite.MANUAL:
+            raise AttributeError("manual test case has no automation_tool")
+        return self._suite._tools.values[code]
+
+    @property
+    def is_automated(self):
+        return self._suite._tool_codes[self._row] != ColumnarTestSuite.MANUAL
+
+    @property
+    def status(self):
+        suite = self._suite
+        return suite._statuses.values[suite._status_codes[self._row]]
+
+    @status.setter
+    def status(self, value):
+        self._suite._set_status(self._row, value)
+
+    @property
+    def test_func(self):
+        return self._suite._funcs.get(self._row)
+
+    def execute_test(self, result):
+        self.status = result
+
+    def display_test_case(self):
+        text = (f"ID: {self.test_id}, Name: {self.test_name}, "
+                f"Module: {self.module}, Status: {self.status}")
+        if self.is_automated:
+            text += f", Tool: {self.automation_tool}"
+        print(text)
+
+    def to_csv_row(self):
+        tool = self.automation_tool if self.is_automated else "NA"
+        return [self.test_id, self.test_name, self.module, self.status, tool]
+
+
+class TestCaseRows(Sequence):
+    # Read-only list of TestCaseRow views handed out as suite.test_cases
+    def __init__(self, suite):
+        self._suite = suite
+
+    def __len__(self):
+        return len(self._suite._ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [TestCaseRow(self._suite, row)
+                    for row in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("test case index out of range")
+        return TestCaseRow(self._suite, index)
+
+
+class RowIdTable:
+    # test_id -> row index for ColumnarTestSuite: an open-addressing hash
+    # table whose slots hold row + 1 (0 = empty) in one array and compare
+    # against the packed id column, instead of a dict entry per test
+    def __init__(self, ids):
+        self._ids = ids
+        self._slots = array("I", bytes(8 * 4))
+        self._used = 0
+
+    def _probe(self, test_id):
+        mask = len(self._slots) - 1
+        slot = hash(test_id) & mask
+        while True:
+            entry = self._slots[slot]
+            if entry == 0 or self._ids[entry - 1] == test_id:
+                return slot
+            slot = (slot + 1) & mask
+
+    def get(self, test_id, default=None):
+        entry = self._slots[self._probe(test_id)]
+        return entry - 1 if entry else default
+
+    def __contains__(self, test_id):
+        return self.get(test_id) is not None
+
+    def __getitem__(self, test_id):
+        row = self.get(test_id)
+        if row is None:
+            raise KeyError(test_id)
+        return row
+
+    def __setitem__(self, test_id, row):
+        slot = self._probe(test_id)
+        if not self._slots[slot]:
+            self._used += 1
+        self._slots[slot] = row + 1
+        if self._used * 2 > len(self._slots):
+            self._grow()
+
+    def _grow(self):
+        old = self._slots
+        self._slots = array("I", bytes(8 * len(old)))
+        for entry in old:
+            if entry:
+                self._slots[self._probe(self._ids[entry - 1])] = entry
+
+
+class ColumnarTestSuite(TestSuite):
+    # Stores test cases column by column instead of as one object per test:
+    # ids and names in packed StringColumns, module/tool/status as int codes in
+    # compact arrays backed by StringTables, callables in a sparse dict.
+    # test_cases yields TestCaseRow views, so the rest of the TestSuite API
+    # (runners, writers, counters) works unchanged.
+    MANUAL = 0  # tool code reserved for manual (non-automated) tests
+
+    def __init__(self, suite_name):
+        # TestSuite.__init__ assigns test_cases = [], which sets up the columns
+        super().__init__(suite_name)
+
+    @property
+    def test_cases(self):
+        return TestCaseRows(self)
+
+    @test_cases.setter
+    def test_cases(self, test_cases):
+        # Replaces the suite's contents, as assigning a list does on TestSuite.
+        # The fields are read first, so the suite's own rows can be passed in.
+        rows = [(t.test_id, t.test_name, t.module, getattr(t, "automation_tool", None),
+                 t.status, t.test_func) for t in test_cases]
+        self._clear()
+        for row in rows:
+            self.add_row(*row)
+
+    def _clear(self):
+        self._ids = StringColumn()
+        self._names = StringColumn()
+        self._modules = StringTable()
+        self._module_codes = array("I")
+        self._tools = StringTable("NA")
+        self._tool_codes = array("H")
+        self._statuses = StringTable("Not Executed", "Pass", "Fail")
+        self._status_codes = array("B")
+        self._funcs = {}
+        self._id_index = RowIdTable(self._ids)
+        self._indexes = {field: RowIndex() for field in INDEXED_FIELDS}
+        self.status_counts.clear()
+        self.module_status_counts.clear()
+        self.tool_status_counts.clear()
+
+    def add_test(self, test_case):
+        # test_case is copied into the columns and not linked to the suite:
+        # later changes to it are not seen by the suite, nor suite runs by it.
+        # Use the returned TestCaseRow view, which has the same API.
+        if test_case.test_id in self._id_index:
+            raise ValueError(f"Duplicate test ID '{test_case.test_id}'")
+        row = self.add_row(test_case.test_id, test_case.test_name, test_case.module,
+                           getattr(test_case, "automation_tool", None),
+                           test_case.status, test_case.test_func)
+        return TestCaseRow(self, row)
+
+    def add_row(self, test_id, test_name, module, automation_tool=None,
+                status="Not Executed", test_func=None):
+        # Bulk-load path: appends a test without building a TestCase object
+        if test_id in self._id_index:
+            raise ValueError(f"Duplicate test ID '{test_id}'")
+        row = len(self._ids)
+        self._ids.append(test_id)
+        self._names.append(test_name)
+        self._module_codes.append(self._modules.code(module))
+        self._tool_codes.append(self.MANUAL if automation_tool is None
+                                else self._tools.code(automation_tool))
+        self._status_codes.append(self._statuses.code(status))
+        if test_func is not None:
+            self._funcs[row] = test_func
+        self._id_index[test_id] = row
+        self._added(row, TestCaseRow(self, row))
+        return row
+
+    def _row_of(self, test_case):
+        return test_case._row
+
+    def _status_at(self, row):
+        return self._statuses.values[self._status_codes[row]]
+
+    def _matcher(self, field, value):
+        # Compares the row's int code, without building a TestCaseRow
+        table, codes = {
+            "module": (self._modules, self._module_codes),
+            "status": (self._statuses, self._status_codes),
+            "automation_tool": (self._tools, self._tool_codes),
+        }[field]
+        code = table.codes.get(value)
+        if code is None:
+            return lambda row: False
+        return lambda row: codes[row] == code
+
+    def _set_status(self, row, value):
+        view = TestCaseRow(self, row)
+        old = view.status
+        self._status_codes[row] = self._statuses.code(value)
+        self._status_changed(view, old, value)
+
+
+# -----------------------------
+# Step 4: Streaming Result Writer
+# -----------------------------
+class ResultWriter:
+    # Appends each result row as tests finish instead of writing the whole
+    # suite at the end. Rows are buffered and flushed every `buffer_size`
+    # results, so a crash loses at most one buffer. With resume=True an
+    # existing file is kept; tests it already holds a result for (any status
+    # but "Not Executed") are skipped by TestSuite.run_all_tests and get that
+    # status back.
+    def __init__(self, file_name, buffer_size=100, resume=False):
+        self.file_name = file_name
+        self.buffer_size = buffer_size
+        self.recorded_results = {}  # test_id -> status from the existing file
+        self._buffer = []
+
+        resuming = resume and os.path.exists(file_name)
+        if resuming:
+            self._drop_partial_line()
+            self.recorded_results = self._read_recorded_results()
+        self._file = open(file_name, mode='a' if resuming else 'w', newline='')
+        self._writer = csv.writer(self._file)
+        if self._file.tell() == 0:
+            self._writer.writerow(CSV_HEADER)
+
+    def _drop_partial_line(self):
+        # A crash mid-write can leave a row without its newline; cut it off
+        # so the test is re-run and appended rows start on a fresh line
+        with open(self.file_name, mode='rb+') as file:
+            size = file.seek(0, os.SEEK_END)
+            pos = size
+            while pos > 0:
+                step = min(4096, pos)
+                file.seek(pos - step)
+                chunk = file.read(step)
+                newline = chunk.rfind(b"\n")
+                if newline != -1:
+                    pos = pos - step + newline + 1
+                    break
+                pos -= step
+            if pos != size:
+                file.truncate(pos)
+
+    @property
+    def recorded_ids(self):
+        return self.recorded_results.keys()
+
+    def _read_recorded_results(self):
+        # Rows of tests that never ran (e.g. from save_results_to_csv) are
+        # not results; a later row for the same test wins
+        status_col = CSV_HEADER.index("Status")
+        recorded = {}
+        with open(self.file_name, mode='r', newline='') as file:
+            reader = csv.reader(file)
+            next(reader, None)  # header
+            for row in reader:
+                if len(row) == len(CSV_HEADER) and row[status_col] != "Not Executed":
+                    recorded[row[0]] = row[status_col]
+        return recorded
+
+    def write(self, test_case):
+        self._buffer.append(test_case.to_csv_row())
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self._writer.writerows(self._buffer)
+            self._buffer.clear()
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
 
 # -----------------------------
@@ -1,29 +1,132 @@
+import sys
+from pathlib import Path
+
 import numpy as ab
 
+# Shared helpers live in the repo-level "common" folder
+sys.path.append(str(Path(__file__).resolve().parent.parent / "common"))
+from quantile_sketch import KLLSketch
+
 # Base class
 class TestReport:
-    def __init__(self, execution_times):
-        # Store execution times as a NumPy array
-        self.execution_times = ab.array(execution_times)
+    def __init__(self, execution_times=(), capacity=16):
+        times = ab.asarray(execution_times)
+        # Growable preallocated buffer; only the first _count slots are used
+        self._buffer = ab.empty(max(capacity, times.size), dtype=times.dtype)
+        self._count = 0
+        # Running aggregates (Welford mean / sum of squared deviations, max)
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._max = None
+        # Streaming quantile sketch fed with the same times
+        self.sketch = KLLSketch()
+        self.append(times)
+
+    @property
+    def execution_times(self):
+        """Execution times recorded so far (a view, not a copy)"""
+        return self._buffer[:self._count]
+
+    def append(self, times):
+        """Add one time or a batch of times; aggregates update in O(batch)"""
+        times = ab.asarray(times).ravel()
+        if times.size == 0:
+            return
+        needed = self._count + times.size
+        dtype = ab.result_type(self._buffer.dtype, times.dtype)
+        if needed > self._buffer.size or dtype != self._buffer.dtype:
+            # Double the capacity so appends are amortized O(1) per value
+            grown = ab.empty(max(needed, 2 * self._buffer.size), dtype=dtype)
+            grown[:self._count] = self.execution_times
+            self._buffer = grown
+        self._buffer[self._count:needed] = times
+
+        # Merge the batch into the running mean/M2 (Chan et al. update)
+        batch_mean = ab.mean(times)
+        batch_m2 = ab.sum((times - batch_mean) ** 2)
+        delta = batch_mean - self._mean
+        self._mean += delta * times.size / needed
+        self._m2 += batch_m2 + delta ** 2 * self._count * times.size / needed
+        batch_max = ab.max(times)
+        self._max = batch_max if self._max is None else max(self._max, batch_max)
+        self._count = needed
+        self.sketch.update(times)
+
+    def count(self):
+        """Return the number of execution times recorded"""
+        return self._count
 
     def average_time(self):
         """Return the mean execution time"""
-        return ab.mean(self.execution_times)
+        return self._mean if self._count else ab.nan
 
     def max_time(self):
         """Return the maximum execution time"""
-        return ab.max(self.execution_times)
+        return self._max
+
+    def variance(self, ddof=0):
+        """Return the variance of execution times (ddof as in np.var)"""
+        if self._count <= ddof:
+            return ab.nan
+        return self._m2 / (self._count - ddof)
+
+    def std_time(self, ddof=0):
+        """Return the standard deviation of execution times"""
+        return ab.sqrt(self.variance(ddof))
+
+    def percentile(self, p):
+        """Return the approximate p-th percentile (0-100) from the sketch"""
+        return self.sketch.percentile(p)
 
 
 # Subclass
 class RegressionReport(TestReport):
-    def __init__(self, execution_times):
+    def __init__(self, execution_times=(), capacity=16, indexed=False):
+        # Sorted index (argsort + sorted times), built on first indexed query
+        self.indexed = indexed
+        self._order = None
+        self._sorted = None
         # Call parent constructor
-        super().__init__(execution_times)
+        super().__init__(execution_times, capacity)
+
+    def append(self, times):
+        """Add times and merge them into the sorted index if it exists"""
+        start = self._count
+        super().append(times)
+        if self._order is None or self._count == start:
+            return
+        new_order = ab.argsort(self.execution_times[start:], kind="stable") + start
+        new_sorted = self.execution_times[new_order]
+        at = ab.searchsorted(self._sorted, new_sorted, side="right")
+        self._order = ab.insert(self._order, at, new_order)
+        self._sorted = ab.insert(self._sorted.astype(new_sorted.dtype, copy=False),
+                                 at, new_sorted)
+
+    def build_index(self):
+        """Sort once so threshold and top-k queries cost O(log n + k)"""
+        self._order = ab.argsort(self.execution_times, kind="stable")
+        self._sorted = self.execution_times[self._order]
 
     def slow_tests(self, threshold):
         """Return tests taking more than threshold seconds"""
-        return self.execution_times[self.execution_times > threshold]
+        if not self.indexed:
+            return self.execution_times[self.execution_times > threshold]
+        # Same result as the mask, in original order, without a full scan
+        return self.execution_times[ab.sort(self.slow_test_positions(threshold))]
+
+    def slow_test_positions(self, threshold):
+        """Return original positions of tests slower than threshold, fastest first"""
+        if self._order is None:
+            self.build_index()
+        start = ab.searchsorted(self._sorted, threshold, side="right")
+        return self._order[start:]
+
+    def top_slowest(self, k):
+        """Return (positions, times) of the k slowest tests, slowest first"""
+        if self._order is None:
+            self.build_index()
+        positions = self._order[::-1][:k]
+        return positions, self.execution_times[positions]
 
 
 # Main section
@@ -32,9 +135,17 @@ if __name__ == "__main__":
     times = ab.array([12, 8, 15, 6, 20, 14, 9, 11, 18, 7])
 
     # Create RegressionReport object
-    report = RegressionReport(times)
+    report = RegressionReport(times, indexed=True)
 
     # Display results
     print("Average Execution Time:", report.average_time())
     print("Maximum Execution Time:", report.max_time())
-    print("Slow Tests (>10s):", report.slow_tests(10))
\ No newline at end of file
+    print("Slow Tests (>10s):", report.slow_tests(10))
+    print("95th Percentile Execution Time:", report.percentile(95))
+    positions, slowest = report.top_slowest(3)
+    print("Top 3 Slowest Tests (position, seconds):", list(zip(positions.tolist(), slowest.tolist())))
+
+    # New timings arrive batch by batch; mean and max stay O(1) to read
+    report.append([25, 5, 13])
+    print("After appending 3 more runs -> Average:", report.average_time(),
+          "Max:", report.max_time(), "Std Dev:", report.std_time())
\ No newline at end of file
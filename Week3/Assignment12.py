@@ -1,29 +1,111 @@
+import sys
+from pathlib import Path
+
 import numpy as np
 
+# Shared helpers live in the repo-level "common" folder
+sys.path.append(str(Path(__file__).resolve().parent.parent / "common"))
+from quantile_sketch import KLLSketch
+
 # Base role classes
+# Each role also declares what it needs (`needs`) and how to print it from
+# precomputed results (`report`), so show_analysis_batch can fuse the work.
 class ManualTester:
+    needs = {"head": 5}
+
     def analyze(self, data):
         # Show the first 5 execution times
         print("ManualTester - First 5 Execution Times:", data[:5])
 
+    def report(self, results):
+        print("ManualTester - First 5 Execution Times:", results["head"][..., :5])
+
 
 class AutomationTester:
+    needs = {"min": True}
+
     def analyze(self, data):
         # Show the fastest test execution time
         print("AutomationTester - Fastest Test Case:", np.min(data))
 
+    def report(self, results):
+        print("AutomationTester - Fastest Test Case:", results["min"])
+
 
 class PerformanceTester:
+    needs = {"percentiles": (95,)}
+
+    def __init__(self, sketch=None):
+        # Streaming sketch of every execution time seen so far; constant
+        # memory, and sketches from other workers can be merged in
+        self.sketch = sketch if sketch is not None else KLLSketch()
+
     def analyze(self, data):
-        # Show the 95th percentile execution time
+        # Show the 95th percentile execution time of this data
+        self.observe(data)
         print("PerformanceTester - 95th Percentile Execution Time:", np.percentile(data, 95))
 
+    def observe(self, data):
+        # Feed execution times into the running sketch (see percentiles())
+        self.sketch.update(data)
+
+    def merge(self, other):
+        # Combine with a PerformanceTester that ran on another worker
+        self.sketch.merge(other.sketch)
+
+    def percentiles(self):
+        # p50 / p95 / p99 over all execution times fed so far
+        p50, p95, p99 = self.sketch.quantiles([0.50, 0.95, 0.99])
+        return {"p50": p50, "p95": p95, "p99": p99}
+
+    def report(self, results):
+        # Exact per-suite value from the fused pass
+        print("PerformanceTester - 95th Percentile Execution Time:", results["percentiles"][95])
+
 
 # Polymorphism function
 def show_analysis(tester, data):
     tester.analyze(data)
 
 
+# Fused analysis for many roles (and many suites) at once
+def batch_analysis(testers, data):
+    """
+    Compute everything the given roles need in one vectorized pass.
+    data is 1-D (one suite) or 2-D (suites x tests); the min and all
+    percentiles come from a single np.partition along the last axis.
+    Percentiles use the same linear interpolation as np.percentile.
+    """
+    data = np.asarray(data)
+    n = data.shape[-1]
+    head = max((t.needs.get("head", 0) for t in testers), default=0)
+    wanted = sorted({p for t in testers for p in t.needs.get("percentiles", ())})
+
+    positions = np.asarray(wanted, dtype=float) / 100 * (n - 1)
+    lower = np.floor(positions).astype(int)
+    upper = np.ceil(positions).astype(int)
+    kth = np.unique(np.concatenate([[0], lower, upper]))
+    part = np.partition(data, kth, axis=-1)
+
+    low, high = part[..., lower], part[..., upper]
+    values = low + (high - low) * (positions - lower)
+    return {
+        "head": data[..., :head],
+        "min": part[..., 0],
+        "percentiles": {p: values[..., i] for i, p in enumerate(wanted)},
+    }
+
+
+def show_analysis_batch(testers, data):
+    results = batch_analysis(testers, data)
+    for tester in testers:
+        tester.report(results)
+        # Roles with running state are fed the same data as in analyze()
+        if hasattr(tester, "observe"):
+            tester.observe(data)
+    return results
+
+
 # Main execution
 if __name__ == "__main__":
     # Create a NumPy array with at least 12 execution times
@@ -38,3 +120,12 @@ if __name__ == "__main__":
     show_analysis(manual, execution_times)
     show_analysis(automation, execution_times)
     show_analysis(performance, execution_times)
+
+    # Same analysis for all roles in one fused pass
+    print("\nBatched analysis (one pass for all roles):")
+    show_analysis_batch([manual, automation, performance], execution_times)
+
+    # Many suites at once: each row is one suite's execution times
+    suites = np.random.default_rng(0).integers(5, 30, size=(3, 12))
+    print("\nBatched analysis over 3 suites:")
+    show_analysis_batch([manual, automation, performance], suites)
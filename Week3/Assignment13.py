@@ -1,5 +1,97 @@
+import tempfile
+from pathlib import Path
+
 import numpy as np
 
+# ----------------------------------------------------------------------
+# Out-of-core helpers: the matrix lives in an .npy file opened as a memmap
+# and is processed a block of tests (columns) at a time, so peak memory
+# stays near one chunk instead of several full-size temporaries.
+# ----------------------------------------------------------------------
+CHUNK_BYTES = 64 * 2**20  # working memory for one chunk
+
+
+def chunk_width(cycles, itemsize, budget=CHUNK_BYTES):
+    """Tests per chunk so a cycles × chunk block of itemsize bytes fits in budget"""
+    return max(1, budget // (cycles * itemsize))
+
+
+def chunks(n_tests, chunk):
+    for start in range(0, n_tests, chunk):
+        yield start, min(start + chunk, n_tests)
+
+
+def create_execution_matrix(path, cycles, tests, low=5, high=51, chunk=None, seed=None):
+    """Write a random cycles × tests matrix to disk chunk by chunk"""
+    rng = np.random.default_rng(seed)
+    chunk = chunk or chunk_width(cycles, np.dtype(np.int32).itemsize)
+    matrix = np.lib.format.open_memmap(path, mode="w+", dtype=np.int32, shape=(cycles, tests))
+    for start, stop in chunks(tests, chunk):
+        matrix[:, start:stop] = rng.integers(low, high, size=(cycles, stop - start), dtype=np.int32)
+    matrix.flush()
+    return matrix
+
+
+def open_execution_matrix(path, mode="r"):
+    return np.load(path, mmap_mode=mode)
+
+
+def cycle_statistics(matrix, chunk=None):
+    """Per-cycle mean, std and overall max in one pass (chunked Welford/Chan merge)"""
+    cycles, tests = matrix.shape
+    chunk = chunk or chunk_width(cycles, 8)  # float64 work buffer
+    count = 0
+    mean = np.zeros(cycles)
+    m2 = np.zeros(cycles)
+    maximum = None
+    buffer = np.empty((cycles, min(chunk, tests)))  # reused for every chunk
+    for start, stop in chunks(tests, chunk):
+        block = matrix[:, start:stop]
+        work = buffer[:, :stop - start]
+        np.copyto(work, block)
+        block_mean = work.mean(axis=1)
+        np.subtract(work, block_mean[:, None], out=work)
+        np.square(work, out=work)
+        block_m2 = work.sum(axis=1)
+
+        n = stop - start
+        delta = block_mean - mean
+        mean += delta * n / (count + n)
+        m2 += block_m2 + delta ** 2 * count * n / (count + n)
+        count += n
+        block_max = block.max()
+        maximum = block_max if maximum is None else max(maximum, block_max)
+    return mean, np.sqrt(m2 / count), maximum
+
+
+def consistent_tests(matrix, threshold, chunk=None):
+    """Indices of tests slower than threshold in every cycle"""
+    chunk = chunk or chunk_width(matrix.shape[0], matrix.itemsize)
+    found = []
+    for start, stop in chunks(matrix.shape[1], chunk):
+        found.append(np.flatnonzero(np.all(matrix[:, start:stop] > threshold, axis=0)) + start)
+    return np.concatenate(found) if found else np.empty(0, dtype=np.intp)
+
+
+def threshold_in_place(matrix, floor, chunk=None):
+    """Raise every time below floor to floor, writing straight into the memmap"""
+    chunk = chunk or chunk_width(matrix.shape[0], matrix.itemsize)
+    for start, stop in chunks(matrix.shape[1], chunk):
+        block = matrix[:, start:stop]
+        np.maximum(block, floor, out=block)
+    matrix.flush()
+
+
+def transform_to(matrix, ufunc, path, dtype=np.float32, chunk=None):
+    """Apply ufunc (np.sqrt, np.log1p, ...) chunk by chunk into a new on-disk matrix"""
+    chunk = chunk or chunk_width(matrix.shape[0], max(matrix.itemsize, np.dtype(dtype).itemsize))
+    out = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=matrix.shape)
+    for start, stop in chunks(matrix.shape[1], chunk):
+        ufunc(matrix[:, start:stop], out=out[:, start:stop], casting="unsafe")
+    out.flush()
+    return out
+
+
 # Generate synthetic dataset: 5 cycles × 50 tests
 data = np.random.randint(5, 51, size=(5, 50))
 print("Execution Data (5 cycles × 50 tests):\n", data)
@@ -56,3 +148,26 @@ print("Tests consistently >25 sec across all cycles:", data[:, consistent])
 thresholded = data.copy()
 thresholded[thresholded < 10] = 10
 print("After thresholding (<10 → 10):\n", thresholded)
+
+print("\n--- 7. Out-of-Core Processing (memory-mapped matrix) ---")
+with tempfile.TemporaryDirectory() as workdir:
+    workdir = Path(workdir)
+    big = create_execution_matrix(workdir / "executions.npy", cycles=20, tests=200_000, seed=7)
+    del big  # reopen read-only below, as a later run would
+
+    big = open_execution_matrix(workdir / "executions.npy")
+    means, stds, big_max = cycle_statistics(big)
+    print("Matrix shape:", big.shape)
+    print("Average per Cycle (first 5):", np.round(means[:5], 3))
+    print("Std Dev per Cycle (first 5):", np.round(stds[:5], 3))
+    print("Maximum Execution Time:", big_max)
+    print("Tests consistently >25 sec:", consistent_tests(big, 25).size)
+
+    logged = transform_to(big, np.log1p, workdir / "log_times.npy")
+    print("Log transform (cycle 1, first 5):", np.round(logged[0, :5], 4))
+    del logged
+
+    big = open_execution_matrix(workdir / "executions.npy", mode="r+")
+    threshold_in_place(big, 10)
+    print("Minimum after thresholding (<10 → 10):", big.min())
+    del big
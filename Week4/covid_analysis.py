@@ -1,15 +1,206 @@
+import csv
+import heapq
+import os
+import sys
+import tempfile
+from pathlib import Path
+
 import pandas as pd
 import numpy as np
 
+# Shared helpers live in the repo-level "common" folder
+sys.path.append(str(Path(__file__).resolve().parent.parent / "common"))
+from covid_data import CountryIndex, load_covid_frame, normalize_covid_frame
+from frame_cache import read_csv_cached
+from quantile_sketch import KLLSketch
+
+# Columns the analyses actually read, and compact dtypes for them
+ANALYSIS_COLUMNS = ["Country/Region", "WHO Region", "Confirmed", "Deaths", "Recovered"]
+COMPACT_DTYPES = {
+    "Country/Region": "category",
+    "WHO Region": "category",
+    "Confirmed": "int32",
+    "Deaths": "int32",
+    "Recovered": "int32",
+    "Active": "int32",
+}
+DEFAULT_CHUNKSIZE = 500_000
+# Default cut-off per outlier method (z-score, robust z-score, IQR multiple)
+OUTLIER_THRESHOLDS = {"zscore": 2.0, "mad": 3.5, "iqr": 1.5}
+
+
+# Positions of the k largest values, largest first (ties keep row order and
+# NaNs are skipped, like nlargest(keep="first")); one O(n) partition + a
+# sort of k items
+def top_k_positions(values, k):
+    values = np.asarray(values)
+    if values.dtype.kind == "f" and np.isnan(values).any():
+        valid = np.flatnonzero(~np.isnan(values))
+        return valid[top_k_positions(values[valid], k)]
+    k = max(0, min(k, values.size))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    kth = np.partition(values, values.size - k)[values.size - k]
+    above = np.flatnonzero(values > kth)
+    ties = np.flatnonzero(values == kth)[:k - above.size]
+    picked = np.sort(np.concatenate([above, ties]))
+    return picked[np.argsort(-values[picked].astype("float64"), kind="stable")]
+
+
+# Sorts a stream of frames by one numeric column without holding them all:
+# each chunk is sorted and written to a run file, then the runs are merged
+# line by line (heapq.merge) into output_file. Ties keep input order.
+def external_sort_csv(chunks, output_file, column, ascending=False, temp_dir=None):
+    with tempfile.TemporaryDirectory(dir=temp_dir) as tmp:
+        header, runs = None, []
+        for i, chunk in enumerate(chunks):
+            header = list(chunk.columns) if header is None else header
+            keys = chunk[column].to_numpy(dtype="float64")
+            order = np.argsort(keys if ascending else -keys, kind="stable")
+            # The sort key is written in front of each row so the merge can
+            # read it without parsing the rest of the CSV line
+            run_df = chunk.iloc[order]
+            run_df.insert(0, "_sort_key", keys[order])
+            run = Path(tmp) / f"run{i}.csv"
+            run_df.to_csv(run, index=False, header=False)
+            runs.append(run)
+        if header is None:
+            raise ValueError("Nothing to sort: no chunks were read")
+
+        missing = float("inf") if ascending else float("-inf")  # NaN rows go last
+
+        def key(line):
+            value = line[:line.index(",")]
+            return float(value) if value else missing
+
+        files = [open(run, newline="") for run in runs]
+        try:
+            with open(output_file, "w", newline="") as out:
+                csv.writer(out, lineterminator=os.linesep).writerow(header)
+                merged = heapq.merge(*files, key=key, reverse=not ascending)
+                out.writelines(line[line.index(",") + 1:] for line in merged)
+        finally:
+            for f in files:
+                f.close()
+
+
+# Group labels as plain values (tuples for several keys), so partial
+# results from chunks with different categories line up
+def _plain_index(index):
+    if isinstance(index, pd.MultiIndex):
+        return index.to_flat_index()
+    return index.astype(object)
+
+
+# Count, mean and sum of squared deviations (M2) per group, updated chunk by
+# chunk and mergeable across workers (Chan et al. pairwise update), so the
+# mean and std of any number of rows come out of a single pass
+class RunningMoments:
+    def __init__(self):
+        self.stats = pd.DataFrame({"n": [], "mean": [], "m2": []})
+
+    def update(self, values, keys):
+        grouped = pd.Series(values, dtype="float64").groupby(keys, observed=True)
+        n = grouped.count()
+        part = pd.DataFrame({"n": n, "mean": grouped.mean(), "m2": grouped.var(ddof=0) * n})
+        part.index = _plain_index(part.index)
+        return self._combine(part[part["n"] > 0])
+
+    def merge(self, other):
+        return self._combine(other.stats)
+
+    def _combine(self, part):
+        a, b = self.stats.align(part, join="outer", fill_value=0)
+        n = a["n"] + b["n"]
+        delta = b["mean"] - a["mean"]
+        self.stats = pd.DataFrame({
+            "n": n,
+            "mean": a["mean"] + delta * b["n"] / n,
+            "m2": a["m2"] + b["m2"] + delta ** 2 * a["n"] * b["n"] / n,
+        })
+        return self
+
+    def mean(self):
+        return self.stats["mean"]
+
+    def std(self, ddof=1):
+        n = self.stats["n"]
+        return np.sqrt(self.stats["m2"] / (n - ddof).where(n > ddof))
+
+
 # ---------------------------
 # Base Class for Data Loading
 # ---------------------------
 class CovidDataLoader:
-    def __init__(self, file_path):
+    # compact=True  -> category / int32 dtypes instead of object / int64
+    #                  (blank count cells become 0)
+    # usecols       -> only parse these columns (e.g. ANALYSIS_COLUMNS)
+    # chunksize     -> do not load the file; stream it in chunks of this many
+    #                  rows and feed the aggregations incrementally
+    def __init__(self, file_path, compact=False, usecols=None, chunksize=None):
         self.file_path = file_path
-        self.df = pd.read_csv(file_path)
+        self.compact = compact
+        self.usecols = usecols
+        self.chunksize = chunksize
+        # Results derived from self.df (e.g. grouped sums), reset when it changes
+        self._cache = {}
+        if chunksize:
+            self.df = None
+        elif compact or usecols is not None:
+            self.df = self._normalize(read_csv_cached(file_path, **self._read_options()))
+        else:
+            # Same normalized frame the other COVID modules get (no re-parse)
+            self.df = load_covid_frame(file_path)
+
+    @property
+    def df(self):
+        return self._df
+
+    @df.setter
+    def df(self, df):
+        self._df = df
+        self.invalidate_cache()
+
+    # Call after editing self.df in place; assigning a new frame does it automatically
+    def invalidate_cache(self):
+        self._cache.clear()
+
+    def _read_options(self):
+        options = {}
+        if self.usecols is not None:
+            options["usecols"] = self.usecols
+        if self.compact:
+            # Counts are parsed as float64: blank cells come back as NaN, which
+            # int32 cannot hold (_normalize narrows them once they are filled)
+            options["dtype"] = {col: "float64" if dtype == "int32" else dtype
+                                for col, dtype in COMPACT_DTYPES.items()
+                                if self.usecols is None or col in self.usecols}
+        return options
+
+    def _normalize(self, frame):
+        frame = normalize_covid_frame(frame, add_active=False)
+        if self.compact:
+            counts = {col: dtype for col, dtype in COMPACT_DTYPES.items()
+                      if dtype == "int32" and col in frame.columns}
+            frame = frame.fillna(dict.fromkeys(counts, 0)).astype(counts)
+        return frame
+
+    @property
+    def streaming(self):
+        return self.df is None
+
+    # Yields the file (or the loaded frame) piece by piece with the same dtypes
+    def iter_chunks(self, chunksize=None):
+        if not self.streaming:
+            yield self.df
+            return
+        size = chunksize or self.chunksize or DEFAULT_CHUNKSIZE
+        for chunk in pd.read_csv(self.file_path, chunksize=size, **self._read_options()):
+            yield self._normalize(chunk)
 
     def get_data(self):
+        if self.streaming:
+            raise ValueError("Data is streamed in chunks; use iter_chunks() or load without chunksize")
         return self.df
 
 
@@ -17,94 +208,251 @@ class CovidDataLoader:
 # Derived Class for Covid Data Analysis
 # -----------------------------------------
 class CovidDataAnalysis(CovidDataLoader):
-    def __init__(self, file_path):
-        super().__init__(file_path)
+    COUNT_COLUMNS = ["Confirmed", "Deaths", "Recovered"]
+
+    def __init__(self, file_path, compact=False, usecols=None, chunksize=None):
+        super().__init__(file_path, compact, usecols, chunksize)
+
+    # Confirmed/Deaths/Recovered sums per group, grouped once and cached;
+    # every region method below derives from this instead of its own groupby
+    def group_totals(self, keys="WHO Region"):
+        cache_key = ("group_totals", keys if isinstance(keys, str) else tuple(keys))
+        if cache_key not in self._cache:
+            key_list = [keys] if isinstance(keys, str) else list(keys)
+            totals = None
+            for chunk in self.iter_chunks():
+                part = self._sum_by(chunk, key_list)
+                if totals is not None:
+                    # Fold each chunk's partial sums into the running totals
+                    part = pd.concat([totals, part]).groupby(level=list(range(len(key_list)))).sum()
+                totals = part
+            self._cache[cache_key] = totals
+        return self._cache[cache_key]
+
+    def _sum_by(self, frame, key_list):
+        # int32 counts are widened first so the totals cannot overflow; counts
+        # with gaps stay float, and sum() skips their NaNs
+        counts = frame[self.COUNT_COLUMNS]
+        counts = counts.astype({col: "int64" for col in counts
+                                if pd.api.types.is_integer_dtype(counts[col])})
+        return counts.groupby([frame[k] for k in key_list], observed=True).sum()
+
+    # Rows matching a condition, from the loaded frame or chunk by chunk
+    def _select(self, condition):
+        parts = [chunk[condition(chunk)] for chunk in self.iter_chunks()]
+        return parts[0] if len(parts) == 1 else pd.concat(parts, ignore_index=True)
+
+    # Group labels for a frame's rows (one group for all rows when no keys)
+    def _group_keys(self, frame, key_list):
+        if not key_list:
+            return np.zeros(len(frame), dtype=np.int8)
+        return frame[key_list[0]] if len(key_list) == 1 else [frame[k] for k in key_list]
+
+    # Per-row value of a per-group Series (NaN for rows outside every group)
+    def _per_row(self, series, frame, key_list):
+        if not key_list:
+            pos = np.zeros(len(frame), dtype=np.intp)
+        elif len(key_list) == 1:
+            pos = series.index.get_indexer(frame[key_list[0]])
+        else:
+            pos = series.index.get_indexer(pd.MultiIndex.from_frame(frame[key_list]).to_flat_index())
+        values = series.to_numpy(dtype="float64")
+        return np.where(pos >= 0, values[pos], np.nan) if len(values) else np.full(len(frame), np.nan)
+
+    # Per-group quantiles of a column (of |value - center| when center is
+    # given): exact in memory, KLL sketches per group when streaming
+    def _group_quantiles(self, column, key_list, qs, center=None):
+        if not self.streaming:
+            values = self.df[column].astype("float64")
+            if center is not None:
+                values = (values - self._per_row(center, self.df, key_list)).abs()
+            table = values.groupby(self._group_keys(self.df, key_list), observed=True).quantile(qs).unstack()
+            table.index = _plain_index(table.index)
+            return [table[q] for q in qs]
+
+        sketches = {}
+        for chunk in self.iter_chunks():
+            values = chunk[column].astype("float64")
+            if center is not None:
+                values = (values - self._per_row(center, chunk, key_list)).abs()
+            for key, group in values.groupby(self._group_keys(chunk, key_list), observed=True):
+                sketches.setdefault(key, KLLSketch()).update(group.dropna().to_numpy())
+        name = key_list[0] if len(key_list) == 1 else None
+        index = pd.Index(list(sketches), dtype=object, name=name, tupleize_cols=False)
+        table = np.array([sketches[key].quantiles(qs) for key in index]).reshape(len(index), len(qs))
+        return [pd.Series(table[:, i], index=index) for i in range(len(qs))]
+
+    # Mortality, recovery and active ratios per group in one frame, divided
+    # column-wise from the cached sums (no per-group Python); groups with
+    # zero confirmed cases get 0 instead of inf/NaN
+    def group_rates(self, keys="WHO Region"):
+        cache_key = ("group_rates", keys if isinstance(keys, str) else tuple(keys))
+        if cache_key not in self._cache:
+            totals = self.group_totals(keys)
+            confirmed = totals["Confirmed"].where(totals["Confirmed"] > 0)
+            active = totals["Confirmed"] - totals["Deaths"] - totals["Recovered"]
+            rates = pd.DataFrame({
+                "Mortality": totals["Deaths"] / confirmed,
+                "Recovery": totals["Recovered"] / confirmed,
+                "Active": active / confirmed,
+            })
+            self._cache[cache_key] = rates.fillna(0)
+        return self._cache[cache_key]
 
     # 1. Summarize Case Counts by Region
     def summarize_by_region(self):
-        summary = self.df.groupby("WHO Region")[["Confirmed", "Deaths", "Recovered"]].sum()
+        summary = self.group_totals().copy()
         print("\n--- Total Confirmed, Deaths, and Recovered by Region ---")
         print(summary)
         return summary
 
     # 2. Filter Low Case Records (<10 confirmed)
     def filter_low_cases(self):
-        filtered = self.df[self.df["Confirmed"] >= 10]
+        filtered = self._select(lambda df: df["Confirmed"] >= 10)
         print("\n--- Filtered Data (Confirmed >= 10) ---")
         print(filtered.head())
         return filtered
 
     # 3. Region with Highest Confirmed Cases
     def highest_confirmed_region(self):
-        region = self.df.groupby("WHO Region")["Confirmed"].sum().idxmax()
+        region = self.group_totals()["Confirmed"].idxmax()
         print("\nRegion with Highest Confirmed Cases:", region)
         return region
 
+    # Rows with the k highest values of a column, largest first; chunked
+    # input keeps only each chunk's top k as candidates
+    def top_rows(self, k, column="Confirmed"):
+        candidates = []
+        for chunk in self.iter_chunks():
+            candidates.append(chunk.iloc[top_k_positions(chunk[column].to_numpy(), k)])
+        rows = candidates[0] if len(candidates) == 1 else pd.concat(candidates)
+        return rows.iloc[top_k_positions(rows[column].to_numpy(), k)]
+
     # 4. Sort Data by Confirmed Cases and Save
-    def sort_by_confirmed(self, output_file="sorted_covid_cases.csv"):
-        sorted_df = self.df.sort_values(by="Confirmed", ascending=False)
+    # top=k       -> only the k highest rows are selected and saved
+    # chunked     -> external sort through run files; returns output_file
+    def sort_by_confirmed(self, output_file="sorted_covid_cases.csv", top=None):
+        if top is not None:
+            sorted_df = self.top_rows(top)
+        elif self.streaming:
+            external_sort_csv(self.iter_chunks(), output_file, "Confirmed")
+            print(f"\nSorted dataset saved to {output_file}")
+            return output_file
+        else:
+            sorted_df = self.df.sort_values(by="Confirmed", ascending=False, kind="stable")
         sorted_df.to_csv(output_file, index=False)
         print(f"\nSorted dataset saved to {output_file}")
         return sorted_df
 
     # 5. Top 5 Countries by Case Count
     def top5_countries(self):
-        top5 = self.df.groupby("Country/Region")["Confirmed"].sum().nlargest(5)
+        confirmed = self.group_totals("Country/Region")["Confirmed"]
+        top5 = confirmed.iloc[top_k_positions(confirmed.to_numpy(), 5)]
         print("\n--- Top 5 Countries by Confirmed Cases ---")
         print(top5)
         return top5
 
     # 6. Region with Lowest Death Count
     def lowest_death_region(self):
-        region = self.df.groupby("WHO Region")["Deaths"].sum().idxmin()
+        region = self.group_totals()["Deaths"].idxmin()
         print("\nRegion with Lowest Death Count:", region)
         return region
 
-    # 7. India’s Case Summary (as of April 29, 2020)
+    # Sorted country index, built once per frame
+    def country_index(self):
+        if "country_index" not in self._cache:
+            self._cache["country_index"] = CountryIndex(self.df)
+        return self._cache["country_index"]
+
+    # Rows for one or more countries via the index (chunk scan when streaming)
+    def country_rows(self, names):
+        if self.streaming:
+            wanted = [names] if isinstance(names, str) else list(names)
+            return self._select(lambda df: df["Country/Region"].isin(wanted))
+        return self.country_index().lookup(names)
+
+    # 7. Country Case Summary
+    def country_summary(self, name):
+        rows = self.country_rows(name)
+        print(f"\n--- {name}’s Case Summary ---")
+        print(rows)
+        return rows
+
+    # 7a. India’s Case Summary (as of April 29, 2020)
     def india_summary(self):
-        india = self.df[self.df["Country/Region"] == "India"]
-        print("\n--- India’s Case Summary ---")
-        print(india)
-        return india
+        return self.country_summary("India")
 
     # 8. Calculate Mortality Rate by Region
     def mortality_rate(self):
-        rates = self.df.groupby("WHO Region").apply(
-            lambda x: x["Deaths"].sum() / x["Confirmed"].sum() if x["Confirmed"].sum() > 0 else 0
-        )
+        rates = self.group_rates()["Mortality"].rename(None)
         print("\n--- Mortality Rate by Region (Deaths/Confirmed) ---")
         print(rates)
         return rates
 
     # 9. Compare Recovery Rates Across Regions
     def recovery_rate(self):
-        rates = self.df.groupby("WHO Region").apply(
-            lambda x: x["Recovered"].sum() / x["Confirmed"].sum() if x["Confirmed"].sum() > 0 else 0
-        )
+        rates = self.group_rates()["Recovery"].rename(None)
         print("\n--- Recovery Rate by Region (Recovered/Confirmed) ---")
         print(rates)
         return rates
 
-    # 10. Detect Outliers in Case Counts (mean ± 2*std)
-    def detect_outliers(self):
-        confirmed = self.df["Confirmed"]
-        mean, std = confirmed.mean(), confirmed.std()
-        lower, upper = mean - 2 * std, mean + 2 * std
-        outliers = self.df[(confirmed < lower) | (confirmed > upper)]
-        print("\n--- Outliers in Confirmed Cases ---")
+    # Lower/upper outlier bounds of a numeric column, per group with by=...
+    # method="zscore" -> mean ± threshold * std (one pass, mergeable moments)
+    # method="mad"    -> median ± threshold * MAD / 0.6745 (robust z-score)
+    # method="iqr"    -> Q1 - threshold * IQR .. Q3 + threshold * IQR
+    # Quantiles are exact in memory and approximate (KLL) when streaming
+    def outlier_bounds(self, column="Confirmed", method="zscore", threshold=None, by=None):
+        if method not in OUTLIER_THRESHOLDS:
+            raise ValueError(f"Unknown outlier method {method!r}; use one of {list(OUTLIER_THRESHOLDS)}")
+        threshold = OUTLIER_THRESHOLDS[method] if threshold is None else threshold
+        key_list = [] if by is None else [by] if isinstance(by, str) else list(by)
+        cache_key = ("outlier_bounds", column, method, threshold, tuple(key_list))
+        if cache_key not in self._cache:
+            if method == "zscore":
+                moments = RunningMoments()
+                for chunk in self.iter_chunks():
+                    moments.update(chunk[column], self._group_keys(chunk, key_list))
+                center, spread = moments.mean(), threshold * moments.std()
+                lower, upper = center - spread, center + spread
+            elif method == "mad":
+                median, = self._group_quantiles(column, key_list, [0.5])
+                mad, = self._group_quantiles(column, key_list, [0.5], center=median)
+                lower, upper = median - threshold * mad / 0.6745, median + threshold * mad / 0.6745
+            else:
+                q1, q3 = self._group_quantiles(column, key_list, [0.25, 0.75])
+                lower, upper = q1 - threshold * (q3 - q1), q3 + threshold * (q3 - q1)
+            self._cache[cache_key] = pd.DataFrame({"lower": lower, "upper": upper})
+        return self._cache[cache_key]
+
+    # Second pass: yields the outlier rows of each chunk (possibly empty)
+    # without collecting them, so any number of rows can be screened
+    def iter_outliers(self, column="Confirmed", method="zscore", threshold=None, by=None):
+        bounds = self.outlier_bounds(column, method, threshold, by)
+        key_list = [] if by is None else [by] if isinstance(by, str) else list(by)
+        for chunk in self.iter_chunks():
+            values = chunk[column].to_numpy(dtype="float64")
+            lower = self._per_row(bounds["lower"], chunk, key_list)
+            upper = self._per_row(bounds["upper"], chunk, key_list)
+            yield chunk[(values < lower) | (values > upper)]
+
+    # 10. Detect Outliers in Case Counts (mean ± 2*std by default)
+    def detect_outliers(self, column="Confirmed", method="zscore", threshold=None, by=None):
+        parts = list(self.iter_outliers(column, method, threshold, by))
+        outliers = parts[0] if len(parts) == 1 else pd.concat(parts)
+        print(f"\n--- Outliers in {column} Cases ---")
         print(outliers)
         return outliers
 
     # 11. Group Data by Country and Region
     def group_country_region(self):
-        grouped = self.df.groupby(["Country/Region", "WHO Region"])[["Confirmed", "Deaths", "Recovered"]].sum()
+        grouped = self.group_totals(["Country/Region", "WHO Region"]).copy()
         print("\n--- Grouped Data by Country and Region ---")
         print(grouped.head())
         return grouped
 
     # 12. Identify Regions with Zero Recovered Cases
     def zero_recovered_regions(self):
-        zero_regions = self.df.groupby("WHO Region")["Recovered"].sum()
+        zero_regions = self.group_totals()["Recovered"]
         zero_regions = zero_regions[zero_regions == 0]
         print("\nRegions with Zero Recovered Cases:")
         print(zero_regions)
@@ -2,19 +2,150 @@
 # covid_eda_visualization.py
 # Usage:
 #   python covid_eda_visualization.py --csv country_wise_latest.csv --out charts
+#   python covid_eda_visualization.py --workers 0   # one process per core
+#
+#   # Several cuts (e.g. one per region) through one long-lived pool:
+#   with RenderPool(workers=4) as pool:
+#       render_many([CovidVisualization(csv, f"charts/{r}", df=df[df["WHO Region"] == r])
+#                    for r in regions], pool=pool)
 #
 # Notes:
 # - Creates an output folder (default: charts) and saves all images there.
 # - Uses only matplotlib (no seaborn) as requested in many coursework rules.
+# - Charts are rendered headless (Agg backend); with --workers they are
+#   spread over a process pool. Each cut's frame is written to disk once and
+#   every worker loads it at most once, however many charts it draws from it.
+# - Each PNG gets a "<name>.png.sha1" sidecar with the hash of the data and
+#   parameters it was drawn from; unchanged charts are not re-rendered
+#   (--force renders everything).
 
 import argparse
+import hashlib
+import itertools
 import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import warnings
 
 import pandas as pd
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
+from matplotlib.colors import LogNorm
+
+# Shared helpers live in the repo-level "common" folder
+sys.path.append(str(Path(__file__).resolve().parent.parent / "common"))
+from covid_data import CountryIndex, load_covid_frame
+from quantile_sketch import KLLSketch
+
+# Bump when a chart's drawing code changes so cached PNGs are re-rendered
+CHART_VERSION = 1
+
+# Above this many rows the scatter and histogram charts are drawn from
+# pre-binned counts (matplotlib only sees the bins, not every point)
+AGGREGATE_ROWS = 200_000
+# Rows binned per np.histogram call, so temporaries stay bounded
+BIN_CHUNK_ROWS = 1_000_000
+# Grid of the aggregated scatter (density) chart
+SCATTER_BINS = 200
+# Cuts (frames) a pool worker keeps loaded; jobs are queued cut by cut
+WORKER_CUTS = 4
+
+
+def binned_counts(values, bins, chunk_rows=BIN_CHUNK_ROWS):
+    """Same counts and edges as np.histogram(values, bins), counted chunk by chunk."""
+    values = np.asarray(values)
+    edges = np.histogram_bin_edges(values, bins)
+    counts = np.zeros(len(edges) - 1)
+    for start in range(0, len(values), chunk_rows):
+        counts += np.histogram(values[start:start + chunk_rows], edges)[0]
+    return counts, edges
+
+
+def binned_counts_2d(x, y, bins, chunk_rows=BIN_CHUNK_ROWS):
+    """np.histogram2d over fixed edges, counted chunk by chunk."""
+    x, y = np.asarray(x), np.asarray(y)
+    x_edges, y_edges = np.histogram_bin_edges(x, bins), np.histogram_bin_edges(y, bins)
+    counts = np.zeros((len(x_edges) - 1, len(y_edges) - 1))
+    for start in range(0, len(x), chunk_rows):
+        stop = start + chunk_rows
+        counts += np.histogram2d(x[start:stop], y[start:stop], [x_edges, y_edges])[0]
+    return counts, x_edges, y_edges
+
+
+def chart_digest(data, **params) -> str:
+    """SHA-1 of a chart's input slice (values, dtypes, labels) and parameters."""
+    frame = data.to_frame() if isinstance(data, pd.Series) else data
+    # Integer indexes are just row positions and are not drawn, so they are
+    # left out; a country or region index is part of the chart
+    with_index = not pd.api.types.is_integer_dtype(frame.index)
+    h = hashlib.sha1()
+    h.update(repr((CHART_VERSION, matplotlib.__version__, sorted(params.items()))).encode())
+    h.update(repr([(str(col), str(dtype)) for col, dtype in frame.dtypes.items()]).encode())
+    h.update(pd.util.hash_pandas_object(frame, index=with_index).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def _fold_whiskers(whislo, whishi, codes, values, lo_fence, hi_fence):
+    # Lowest value >= lo_fence and highest value <= hi_fence per group code
+    inside = codes >= 0
+    codes, values = codes[inside], values[inside].astype("float64", copy=False)
+    low, high = values >= lo_fence[codes], values <= hi_fence[codes]
+    np.minimum.at(whislo, codes[low], values[low])
+    np.maximum.at(whishi, codes[high], values[high])
+
+
+def _box_frame(labels, q1, med, q3, whislo, whishi, name):
+    return pd.DataFrame(
+        {"q1": q1, "med": med, "q3": q3,
+         "whislo": np.minimum(whislo, q1), "whishi": np.maximum(whishi, q3)},
+        index=pd.Index(np.asarray(labels).astype(str), name=name),
+    )
+
+
+def box_stats(values, keys, whis=1.5, chunk_rows=BIN_CHUNK_ROWS) -> pd.DataFrame:
+    """
+    Per-group box plot statistics (q1, med, q3, whislo, whishi) from one
+    grouped quantile pass, computed the way plt.boxplot does; rows are the
+    sorted group labels. Feed them to Axes.bxp instead of per-group arrays.
+    """
+    codes, labels = pd.factorize(keys, sort=True)
+    values = np.asarray(values)
+    quartiles = pd.Series(values).groupby(codes).quantile([0.25, 0.5, 0.75]).unstack()
+    # Rows without a group (code -1) are left out, as in groupby
+    q1, med, q3 = quartiles.reindex(range(len(labels))).to_numpy().T
+    # Whiskers reach the most extreme values still within whis * IQR
+    lo_fence, hi_fence = q1 - whis * (q3 - q1), q3 + whis * (q3 - q1)
+    whislo, whishi = np.full(len(labels), np.inf), np.full(len(labels), -np.inf)
+    for start in range(0, len(values), chunk_rows):
+        stop = start + chunk_rows
+        _fold_whiskers(whislo, whishi, codes[start:stop], values[start:stop], lo_fence, hi_fence)
+    return _box_frame(labels, q1, med, q3, whislo, whishi, getattr(keys, "name", None))
+
+
+def box_stats_chunked(make_chunks, value_col, key_col, whis=1.5) -> pd.DataFrame:
+    """
+    box_stats for data that does not fit in memory. make_chunks() must return
+    a fresh iterable of frames on each call: the first pass feeds one KLL
+    sketch per group (approximate quartiles), the second finds the whiskers.
+    """
+    sketches = {}
+    for chunk in make_chunks():
+        for key, group in chunk[value_col].groupby(chunk[key_col], observed=True):
+            sketches.setdefault(key, KLLSketch()).update(group.to_numpy())
+    groups = pd.Index(sorted(sketches), dtype=object)
+    quartiles = np.array([sketches[key].quantiles([0.25, 0.5, 0.75]) for key in groups])
+    q1, med, q3 = quartiles.reshape(len(groups), 3).T
+    lo_fence, hi_fence = q1 - whis * (q3 - q1), q3 + whis * (q3 - q1)
+
+    whislo, whishi = np.full(len(groups), np.inf), np.full(len(groups), -np.inf)
+    for chunk in make_chunks():
+        codes = groups.get_indexer(chunk[key_col])
+        _fold_whiskers(whislo, whishi, codes, chunk[value_col].to_numpy(dtype="float64"),
+                       lo_fence, hi_fence)
+    return _box_frame(groups, q1, med, q3, whislo, whishi, key_col)
 
 
 class CovidAnalysis:
@@ -25,9 +156,23 @@ class CovidAnalysis:
       Country/Region, Confirmed, Deaths, Recovered, Active, WHO Region
     """
 
-    def __init__(self, csv_path: str):
+    def __init__(self, csv_path: str, df: pd.DataFrame = None):
         self.csv_path = csv_path
-        self.df = self._load()
+        # A prepared frame (e.g. a regional cut, or one sent to a worker) skips loading
+        self.df = self._load() if df is None else df
+
+    @property
+    def df(self) -> pd.DataFrame:
+        return self._df
+
+    @df.setter
+    def df(self, df: pd.DataFrame):
+        self._df = df
+        self.invalidate_cache()
+
+    def invalidate_cache(self):
+        """Forget memoized slices; call after editing self.df in place (assigning does it)."""
+        self._cache = {}
 
     def _load(self) -> pd.DataFrame:
         if not Path(self.csv_path).exists():
@@ -35,16 +180,9 @@ class CovidAnalysis:
                 f"CSV not found: {self.csv_path}\n"
                 "Tip: put 'country_wise_latest.csv' next to this script, or pass --csv <path>."
             )
-        df = pd.read_csv(self.csv_path)
-
-        # Normalize expected column names if there are small variations
-        rename_map = {
-            "Country_Region": "Country/Region",
-            "Country": "Country/Region",
-            "WHO_Region": "WHO Region",
-            "Region": "WHO Region",
-        }
-        df = df.rename(columns=rename_map)
+        # Shared loader: column renaming, numeric coercion, WHO Region
+        # placeholder and Active are handled once for all COVID modules
+        df = load_covid_frame(self.csv_path, fill_counts=True)
 
         # Ensure essential columns exist
         required = ["Country/Region", "Confirmed", "Deaths", "Recovered"]
@@ -52,34 +190,36 @@ class CovidAnalysis:
             if col not in df.columns:
                 raise ValueError(f"Expected column '{col}' not found in CSV.")
 
-        # If WHO Region missing, create a placeholder
-        if "WHO Region" not in df.columns:
-            df["WHO Region"] = "Unknown"
-
-        # Fill numeric NaNs with zeros
-        for col in ["Confirmed", "Deaths", "Recovered"]:
-            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(int)
-
-        # Derive Active if missing
-        if "Active" not in df.columns:
-            df["Active"] = (df["Confirmed"] - df["Deaths"] - df["Recovered"]).clip(lower=0)
-
         return df
 
-    # Helper data slices used by visualization
+    # Helper data slices used by visualization (memoized per frame; callers
+    # get shallow copies, so editing a result never changes the cache)
     def top_n_by_confirmed(self, n=10) -> pd.DataFrame:
-        return self.df.nlargest(n, "Confirmed")[["Country/Region", "Confirmed", "Deaths", "Recovered", "Active"]]
+        # One cached top-n serves every smaller n: nlargest(n) keeps the
+        # first rows on ties, so it is exactly the head of a larger top-n
+        cached = self._cache.get("top_n")
+        if cached is None or len(cached) < min(n, len(self.df)):
+            cached = self._cache["top_n"] = self.df.nlargest(n, "Confirmed")[
+                ["Country/Region", "Confirmed", "Deaths", "Recovered", "Active"]]
+        return cached.head(n).copy(deep=False)
 
     def region_group(self) -> pd.DataFrame:
-        return (
-            self.df.groupby("WHO Region", dropna=False)[["Confirmed", "Deaths", "Recovered", "Active"]]
-            .sum()
-            .sort_values("Confirmed", ascending=False)
-        )
+        if "region_group" not in self._cache:
+            self._cache["region_group"] = (
+                self.df.groupby("WHO Region", dropna=False)[["Confirmed", "Deaths", "Recovered", "Active"]]
+                .sum()
+                .sort_values("Confirmed", ascending=False)
+            )
+        return self._cache["region_group"].copy(deep=False)
+
+    def country_index(self) -> CountryIndex:
+        if "country_index" not in self._cache:
+            self._cache["country_index"] = CountryIndex(self.df)
+        return self._cache["country_index"]
 
     def country_slice(self, countries: list[str]) -> pd.DataFrame:
         return (
-            self.df[self.df["Country/Region"].isin(countries)]
+            self.country_index().lookup(countries)
             .set_index("Country/Region")[["Confirmed", "Deaths", "Recovered"]]
             .sort_values("Confirmed", ascending=False)
         )
@@ -88,35 +228,87 @@ class CovidAnalysis:
 class CovidVisualization(CovidAnalysis):
     """Adds plotting/EDA methods on top of CovidAnalysis."""
 
-    def __init__(self, csv_path: str, out_dir: str = "charts"):
-        super().__init__(csv_path)
+    def __init__(self, csv_path: str, out_dir: str = "charts", df: pd.DataFrame = None,
+                 use_cache: bool = True):
+        super().__init__(csv_path, df)
         self.out_dir = Path(out_dir)
         self.out_dir.mkdir(parents=True, exist_ok=True)
+        # use_cache=False re-renders every chart even if its inputs are unchanged
+        self.use_cache = use_cache
+        self._pending_digests = {}
         # Matplotlib warnings (fonts, etc.) can be noisy in some setups—silence non-critical ones
         warnings.filterwarnings("ignore", category=UserWarning, module="matplotlib")
 
-    # Utility: save and close
-    def _save(self, name: str):
+    # Utility: path of an up-to-date PNG for these inputs, or None if the
+    # chart has to be drawn (the digest is then written by _save)
+    def _reuse(self, name: str, data, **params):
+        out_path = self.out_dir / f"{name}.png"
+        sidecar = self.out_dir / f"{name}.png.sha1"
+        digest = chart_digest(data, **params)
+        if self.use_cache and out_path.exists() and sidecar.exists() \
+                and sidecar.read_text().strip() == digest:
+            print(f"Unchanged: {out_path}")
+            return out_path
+        # Drop the old digest first so a failed render never looks current
+        sidecar.unlink(missing_ok=True)
+        self._pending_digests[name] = digest
+        return None
+
+    # Utility: save and close; returns the file written
+    def _save(self, name: str) -> Path:
         out_path = self.out_dir / f"{name}.png"
         plt.tight_layout()
         plt.savefig(out_path, dpi=160, bbox_inches="tight")
         plt.close()
+        digest = self._pending_digests.pop(name, None)
+        if digest is not None:
+            # One sidecar per chart, written via a temp file, so parallel
+            # workers never touch the same file
+            sidecar = self.out_dir / f"{name}.png.sha1"
+            tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+            tmp.write_text(digest + "\n")
+            os.replace(tmp, sidecar)
         print(f"Saved: {out_path}")
+        return out_path
+
+    # (method, args) of every chart, in order
+    def chart_jobs(self, other_country: str = "United States") -> list[tuple]:
+        return [
+            ("bar_top10_confirmed", ()),
+            ("pie_deaths_by_region", ()),
+            ("line_confirmed_vs_deaths_top5", ()),
+            ("scatter_confirmed_vs_recovered", ()),
+            ("hist_deaths_all_regions", ()),
+            ("stacked_bar_selected_countries", ()),
+            ("boxplot_confirmed_by_region", ()),
+            ("trendline_india_vs", (other_country,)),
+        ]
+
+    # All charts, in order: one process when workers == 1, otherwise a pool of
+    # that many processes (0/None = one per core), or the long-lived pool
+    # given. Returns the saved paths.
+    def render_all(self, workers: int = 1, other_country: str = "United States",
+                   pool: "RenderPool" = None) -> list[Path]:
+        return render_many([self], workers, other_country, pool)[0]
 
     # 1) Bar Chart of Top 10 Countries by Confirmed Cases
     def bar_top10_confirmed(self):
         data = self.top_n_by_confirmed(10)
+        if (cached := self._reuse("1_bar_top10_confirmed", data)) is not None:
+            return cached
         plt.figure(figsize=(10, 5))
         plt.bar(data["Country/Region"], data["Confirmed"])
         plt.title("Top 10 Countries by Confirmed Cases")
         plt.xlabel("Country")
         plt.ylabel("Confirmed Cases")
         plt.xticks(rotation=45, ha="right")
-        self._save("1_bar_top10_confirmed")
+        return self._save("1_bar_top10_confirmed")
 
     # 2) Pie Chart of Global Death Distribution by Region
     def pie_deaths_by_region(self):
         grp = self.region_group()
+        if (cached := self._reuse("2_pie_deaths_by_region", grp["Deaths"])) is not None:
+            return cached
         values = grp["Deaths"]
         labels = grp.index.astype(str)
         plt.figure(figsize=(7, 7))
@@ -128,11 +320,13 @@ class CovidVisualization(CovidAnalysis):
             labels = values.index
         plt.pie(values, labels=labels, autopct="%1.1f%%", startangle=90)
         plt.title("Global Death Distribution by WHO Region")
-        self._save("2_pie_deaths_by_region")
+        return self._save("2_pie_deaths_by_region")
 
     # 3) Line Chart comparing Confirmed and Deaths for Top 5 Countries
     def line_confirmed_vs_deaths_top5(self):
         top5 = self.top_n_by_confirmed(5).set_index("Country/Region")
+        if (cached := self._reuse("3_line_confirmed_vs_deaths_top5", top5)) is not None:
+            return cached
         plt.figure(figsize=(9, 5))
         plt.plot(top5.index, top5["Confirmed"], marker="o", label="Confirmed")
         plt.plot(top5.index, top5["Deaths"], marker="o", label="Deaths")
@@ -141,31 +335,56 @@ class CovidVisualization(CovidAnalysis):
         plt.ylabel("Count")
         plt.legend()
         plt.xticks(rotation=20, ha="right")
-        self._save("3_line_confirmed_vs_deaths_top5")
+        return self._save("3_line_confirmed_vs_deaths_top5")
 
     # 4) Scatter Plot of Confirmed vs Recovered Cases
-    def scatter_confirmed_vs_recovered(self):
+    # aggregate=True draws a density grid instead of one marker per row
+    # (default: only above AGGREGATE_ROWS rows)
+    def scatter_confirmed_vs_recovered(self, aggregate=None):
+        data = self.df[["Confirmed", "Recovered"]]
+        aggregate = len(data) > AGGREGATE_ROWS if aggregate is None else aggregate
+        if (cached := self._reuse("4_scatter_confirmed_vs_recovered", data,
+                                  aggregate=aggregate, bins=SCATTER_BINS)) is not None:
+            return cached
         plt.figure(figsize=(7, 5))
-        plt.scatter(self.df["Confirmed"], self.df["Recovered"], alpha=0.6)
+        if aggregate:
+            counts, x_edges, y_edges = binned_counts_2d(data["Confirmed"], data["Recovered"], SCATTER_BINS)
+            # Empty cells stay blank; colour is the number of rows in the cell
+            mesh = plt.pcolormesh(x_edges, y_edges, np.ma.masked_equal(counts.T, 0), norm=LogNorm())
+            plt.colorbar(mesh, label="Rows per cell")
+        else:
+            plt.scatter(data["Confirmed"], data["Recovered"], alpha=0.6)
         plt.title("Confirmed vs Recovered (All Countries)")
         plt.xlabel("Confirmed")
         plt.ylabel("Recovered")
-        self._save("4_scatter_confirmed_vs_recovered")
+        return self._save("4_scatter_confirmed_vs_recovered")
 
     # 5) Histogram of Death Counts across all Regions (country-level distribution)
-    def hist_deaths_all_regions(self):
+    # aggregate=True counts the bins first (in chunks) and draws only those;
+    # the bars are identical to plt.hist on the raw values
+    def hist_deaths_all_regions(self, aggregate=None):
+        deaths = self.df["Deaths"]
+        aggregate = len(deaths) > AGGREGATE_ROWS if aggregate is None else aggregate
+        if (cached := self._reuse("5_hist_deaths_all_regions", deaths, bins=30)) is not None:
+            return cached
         plt.figure(figsize=(8, 5))
-        plt.hist(self.df["Deaths"], bins=30)
+        if aggregate:
+            counts, edges = binned_counts(deaths, 30)
+            plt.hist(edges[:-1], bins=edges, weights=counts)
+        else:
+            plt.hist(deaths, bins=30)
         plt.title("Histogram of Death Counts (Country Level)")
         plt.xlabel("Deaths")
         plt.ylabel("Frequency")
-        self._save("5_hist_deaths_all_regions")
+        return self._save("5_hist_deaths_all_regions")
 
     # 6) Stacked Bar Chart of Confirmed, Deaths, Recovered for 5 Selected Countries
     def stacked_bar_selected_countries(self, countries=None):
         if countries is None:
             countries = ["India", "United States", "Brazil", "Russia", "United Kingdom"]
         data = self.country_slice(countries)
+        if (cached := self._reuse("6_stacked_confirmed_deaths_recovered", data)) is not None:
+            return cached
         x = np.arange(len(data.index))
         width = 0.6
 
@@ -179,20 +398,28 @@ class CovidVisualization(CovidAnalysis):
         plt.xlabel("Country")
         plt.ylabel("Count")
         plt.legend()
-        self._save("6_stacked_confirmed_deaths_recovered")
+        return self._save("6_stacked_confirmed_deaths_recovered")
 
     # 7) Box Plot of Confirmed Cases across Regions
-    def boxplot_confirmed_by_region(self):
-        grp = self.df[["WHO Region", "Confirmed"]].copy()
-        groups = [g["Confirmed"].values for _, g in grp.groupby("WHO Region")]
-        labels = [str(k) for k, _ in grp.groupby("WHO Region")]
-        plt.figure(figsize=(10, 5))
-        plt.boxplot(groups, labels=labels, showfliers=False)
+    # Quartiles and whiskers come from one grouped pass and are drawn with
+    # ax.bxp, so no per-region arrays are built. chunks: optional callable
+    # returning an iterable of frames, for input that is not in memory.
+    def boxplot_confirmed_by_region(self, chunks=None):
+        if chunks is None:
+            stats = box_stats(self.df["Confirmed"], self.df["WHO Region"])
+        else:
+            stats = box_stats_chunked(chunks, "Confirmed", "WHO Region")
+        # The chart depends only on these statistics, so they are what is hashed
+        if (cached := self._reuse("7_boxplot_confirmed_by_region", stats)) is not None:
+            return cached
+        _, ax = plt.subplots(figsize=(10, 5))
+        ax.bxp([{"label": label, **row} for label, row in stats.to_dict("index").items()],
+               showfliers=False)
         plt.title("Box Plot: Confirmed Cases by WHO Region")
         plt.xlabel("WHO Region")
         plt.ylabel("Confirmed")
         plt.xticks(rotation=20, ha="right")
-        self._save("7_boxplot_confirmed_by_region")
+        return self._save("7_boxplot_confirmed_by_region")
 
     # 8) Trend Line: Plot Confirmed for India vs another country (side-by-side bars act as 'trend' snapshot)
     # If your dataset had time series, we'd plot over time; this snapshot compares totals.
@@ -200,13 +427,105 @@ class CovidVisualization(CovidAnalysis):
         countries = ["India", other_country]
         data = self.country_slice(countries)
         data = data.reindex(countries)  # keep order
+        name = f"8_trend_india_vs_{other_country.replace(' ', '_')}"
+        if (cached := self._reuse(name, data)) is not None:
+            return cached
 
         plt.figure(figsize=(7, 5))
         plt.bar(data.index, data["Confirmed"])
         plt.title(f"Confirmed Cases: India vs {other_country}")
         plt.xlabel("Country")
         plt.ylabel("Confirmed")
-        self._save(f"8_trend_india_vs_{other_country.replace(' ', '_')}")
+        return self._save(name)
+
+
+class RenderPool:
+    """
+    Long-lived process pool for rendering the charts of many cuts.
+
+    A cut's frame is pickled to a temp file the first time one of its charts
+    is submitted (again only if the cut gets a new frame); tasks carry just
+    the file name. Each worker loads a cut once and keeps the last
+    WORKER_CUTS of them, so chart jobs of all cuts share one set of workers
+    and no frame is sent per chart or per worker start-up.
+    """
+
+    def __init__(self, workers: int = None):
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_render_worker)
+        self._frames = tempfile.TemporaryDirectory(prefix="covid_cuts_")
+        self._shipped = {}  # id(viz) -> (viz, frame, cut key)
+        self._keys = itertools.count()
+
+    def _cut_key(self, viz) -> str:
+        entry = self._shipped.get(id(viz))
+        if entry is None or entry[0] is not viz or entry[1] is not viz.df:
+            entry = self._shipped[id(viz)] = (viz, viz.df, f"cut{next(self._keys)}")
+            viz.df.to_pickle(Path(self._frames.name) / f"{entry[2]}.pkl")
+        return entry[2]
+
+    def submit(self, viz, name: str, args=()):
+        """Future for one chart of one cut."""
+        key = self._cut_key(viz)
+        spec = (type(viz), viz.csv_path, viz.out_dir, viz.use_cache)
+        return self._executor.submit(_render_chart, key, Path(self._frames.name) / f"{key}.pkl",
+                                     spec, name, args)
+
+    def close(self):
+        self._executor.shutdown()
+        self._shipped.clear()
+        self._frames.cleanup()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def render_many(cuts, workers: int = 1, other_country: str = "United States",
+                pool: RenderPool = None) -> list[list[Path]]:
+    """
+    Render every chart of every cut (CovidVisualization objects) and return
+    their paths, one list per cut. All cut x chart jobs go through one pool:
+    the one given, or one of `workers` processes for this call (workers == 1
+    renders in this process).
+    """
+    jobs = [(viz, viz.chart_jobs(other_country)) for viz in cuts]
+    if pool is None and workers == 1:
+        return [[getattr(viz, name)(*args) for name, args in charts] for viz, charts in jobs]
+
+    owned = pool is None
+    if owned:
+        total = sum(len(charts) for _, charts in jobs)
+        pool = RenderPool(min(total, workers or os.cpu_count() or 1))
+    try:
+        # Submitted cut by cut, so a worker mostly reuses the cut it just loaded
+        futures = [[pool.submit(viz, name, args) for name, args in charts] for viz, charts in jobs]
+        return [[future.result() for future in row] for row in futures]
+    finally:
+        if owned:
+            pool.close()
+
+
+# Process-pool workers render on the Agg backend and keep a visualization per
+# recently used cut, built around the frame file the first task brought
+_worker_views = {}
+
+
+def _init_render_worker():
+    plt.switch_backend("Agg")
+
+
+def _render_chart(key, frame_file, spec, name, args):
+    viz = _worker_views.pop(key, None)
+    if viz is None:
+        viz_class, csv_path, out_dir, use_cache = spec
+        viz = viz_class(csv_path, out_dir, df=pd.read_pickle(frame_file), use_cache=use_cache)
+    _worker_views[key] = viz  # most recently used last
+    while len(_worker_views) > WORKER_CUTS:
+        del _worker_views[next(iter(_worker_views))]
+    return getattr(viz, name)(*args)
 
 
 def main():
@@ -214,19 +533,18 @@ def main():
     parser.add_argument("--csv", default="country_wise_latest.csv", help="Path to country_wise_latest.csv")
     parser.add_argument("--out", default="charts", help="Output folder to save charts")
     parser.add_argument("--other", default="United States", help="Other country for the India comparison")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Processes to render charts with (0 = one per CPU core)")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-render every chart even if its data is unchanged")
     args = parser.parse_args()
 
-    viz = CovidVisualization(args.csv, args.out)
+    # Files only, no windows: the non-interactive backend is enough
+    plt.switch_backend("Agg")
+    viz = CovidVisualization(args.csv, args.out, use_cache=not args.force)
 
     # Generate all required charts
-    viz.bar_top10_confirmed()
-    viz.pie_deaths_by_region()
-    viz.line_confirmed_vs_deaths_top5()
-    viz.scatter_confirmed_vs_recovered()
-    viz.hist_deaths_all_regions()
-    viz.stacked_bar_selected_countries()
-    viz.boxplot_confirmed_by_region()
-    viz.trendline_india_vs(args.other)
+    viz.render_all(workers=args.workers, other_country=args.other)
 
     print("\nAll charts generated successfully.")
 
@@ -1,4 +1,5 @@
 # covid_eda.py
+import sys
 import pandas as pd
 import numpy as np
 import seaborn as sns
@@ -6,6 +7,10 @@ import matplotlib.pyplot as plt
 from sklearn.preprocessing import StandardScaler
 from pathlib import Path
 
+# Shared helpers live in the repo-level "common" folder
+sys.path.append(str(Path(__file__).resolve().parent.parent / "common"))
+from covid_data import load_covid_frame
+
 
 class CovidEDA:
     def __init__(self, csv_path: str):
@@ -20,17 +25,8 @@ class CovidEDA:
     def load_and_prepare(self):
         if not self.csv_path.exists():
             raise FileNotFoundError(f"CSV not found: {self.csv_path.resolve()}")
-        df = pd.read_csv(self.csv_path)
-
-        # Try to normalize likely column name variants
-        rename_map = {}
-        for c in df.columns:
-            lc = c.strip().lower()
-            if lc in {"confirmed", "confirmedcases", "totalconfirmed"}:
-                rename_map[c] = "Confirmed"
-            if lc in {"new cases", "newcases", "new_case", "new_case(s)", "new"}:
-                rename_map[c] = "New cases"
-        df = df.rename(columns=rename_map)
+        # Shared loader: column name variants are normalized there
+        df = load_covid_frame(self.csv_path)
 
         missing = [c for c in self.cols if c not in df.columns]
         if missing:
@@ -0,0 +1,50 @@
+# benchmark_frame_cache.py
+# Cold (text parse) vs warm (memory-mapped cache) load times for read_csv_cached.
+#
+# Usage:
+#   python benchmark_frame_cache.py --csv ../Week5/country_wise_latest.csv --rows 2000000
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from frame_cache import read_csv_cached
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the binary CSV cache.")
+    parser.add_argument("--csv", default=str(Path(__file__).resolve().parent.parent / "Week5" / "country_wise_latest.csv"),
+                        help="Seed CSV; its rows are repeated to reach --rows")
+    parser.add_argument("--rows", type=int, default=2_000_000, help="Rows in the generated CSV")
+    args = parser.parse_args()
+
+    seed = pd.read_csv(args.csv)
+    repeats = max(1, args.rows // len(seed))
+    with tempfile.TemporaryDirectory() as workdir:
+        big_csv = Path(workdir) / "covid_big.csv"
+        pd.concat([seed] * repeats, ignore_index=True).to_csv(big_csv, index=False)
+        size_mb = big_csv.stat().st_size / 1e6
+
+        cold, df = timed(lambda: pd.read_csv(big_csv))
+        first, _ = timed(lambda: read_csv_cached(big_csv))
+        warm, cached = timed(lambda: read_csv_cached(big_csv))
+        shapes_match = cached.shape == df.shape
+
+    print(f"Rows x columns         : {df.shape[0]:,} x {df.shape[1]} ({size_mb:.0f} MB CSV)")
+    print(f"Cold pd.read_csv       : {cold:8.3f} s")
+    print(f"First cached load      : {first:8.3f} s  (parse + write cache)")
+    print(f"Warm cached load       : {warm:8.3f} s  (memory-mapped)")
+    print(f"Speedup (cold / warm)  : {cold / warm:8.1f}x  shapes match: {shapes_match}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+# covid_data.py
+# Shared loading and normalization for the COVID-19 analysis modules
+# (Week4 CovidDataAnalysis, Week5 CovidVisualization, Week6 CovidEDA).
+#
+# Usage:
+#   df = load_covid_frame("country_wise_latest.csv")
+#   df = load_covid_frame("country_wise_latest.csv", fill_counts=True)
+#
+# Notes:
+# - Column names are mapped to one canonical set and a missing "WHO Region" /
+#   "Active" is filled in. Missing counts stay NaN unless fill_counts=True,
+#   which coerces the count columns to integers (NaN -> 0).
+# - A process-wide registry parses and normalizes each file once; under
+#   copy-on-write (pandas 3, or enabled by the application) every caller gets
+#   a shallow copy of the same frame, otherwise a deep copy.
+
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from frame_cache import read_csv_cached
+
+# Lower-cased name variants seen in the different exports -> canonical name
+COLUMN_ALIASES = {
+    "country/region": "Country/Region",
+    "country_region": "Country/Region",
+    "country": "Country/Region",
+    "who region": "WHO Region",
+    "who_region": "WHO Region",
+    "region": "WHO Region",
+    "confirmed": "Confirmed",
+    "confirmedcases": "Confirmed",
+    "totalconfirmed": "Confirmed",
+    "new cases": "New cases",
+    "newcases": "New cases",
+    "new_case": "New cases",
+    "new_case(s)": "New cases",
+    "new": "New cases",
+}
+COUNT_COLUMNS = ["Confirmed", "Deaths", "Recovered"]
+
+
+def normalize_covid_frame(df: pd.DataFrame, add_active: bool = True,
+                          fill_counts: bool = False) -> pd.DataFrame:
+    """Canonical column names, derived columns, and integer counts (NaN -> 0) when fill_counts."""
+    rename_map = {}
+    for col in df.columns:
+        target = COLUMN_ALIASES.get(col.strip().lower())
+        if target is not None and target != col and target not in df.columns \
+                and target not in rename_map.values():
+            rename_map[col] = target
+    df = df.rename(columns=rename_map)
+
+    # Fill numeric NaNs with zeros (integer columns without gaps are kept as is)
+    if fill_counts:
+        for col in COUNT_COLUMNS:
+            if col in df.columns and (df[col].hasnans or not pd.api.types.is_integer_dtype(df[col])):
+                df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype("int64")
+
+    # If WHO Region missing, create a placeholder
+    if "WHO Region" not in df.columns:
+        df["WHO Region"] = "Unknown"
+
+    # Derive Active if missing
+    if add_active and "Active" not in df.columns and all(c in df.columns for c in COUNT_COLUMNS):
+        df["Active"] = (df["Confirmed"] - df["Deaths"] - df["Recovered"]).clip(lower=0)
+    return df
+
+
+class CountryIndex:
+    """
+    Sorted lookup index over a frame's country column.
+
+    Built once from integer country codes (one factorize + one stable sort);
+    each lookup is then a binary search over the distinct names plus the
+    matching rows, O(log n + k) instead of a full-column scan. Rows of one
+    country keep their original (e.g. date) order.
+    """
+
+    def __init__(self, df: pd.DataFrame, column: str = "Country/Region"):
+        codes, uniques = pd.factorize(df[column])
+        names = np.asarray(uniques.astype(str), dtype=str)
+        # Renumber the codes so that code order is alphabetical name order
+        by_name = np.argsort(names, kind="stable")
+        rank = np.empty_like(by_name)
+        rank[by_name] = np.arange(len(by_name))
+        codes = np.where(codes >= 0, rank[np.maximum(codes, 0)], -1)
+
+        self.frame = df
+        self.names = names[by_name]
+        self.order = np.argsort(codes, kind="stable")  # missing names (-1) sort first
+        counts = np.bincount(codes[codes >= 0], minlength=len(names))
+        self.bounds = np.concatenate([[0], np.cumsum(counts)]) + np.count_nonzero(codes < 0)
+
+    def positions(self, names) -> np.ndarray:
+        """Row positions for one country name or a list of names (in the order given)."""
+        names = [names] if isinstance(names, str) else list(dict.fromkeys(names))
+        wanted = np.asarray(names, dtype=str)
+        slots = np.searchsorted(self.names, wanted)
+        parts = [self.order[self.bounds[slot]:self.bounds[slot + 1]]
+                 for slot, name in zip(slots, wanted)
+                 if slot < len(self.names) and self.names[slot] == name]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.intp)
+
+    def lookup(self, names) -> pd.DataFrame:
+        return self.frame.iloc[self.positions(names)]
+
+
+def copy_on_write() -> bool:
+    """Whether pandas copy-on-write is active (always from pandas 3 on)."""
+    return int(pd.__version__.split(".")[0]) >= 3 or pd.options.mode.copy_on_write is True
+
+
+class DatasetRegistry:
+    """
+    Process-wide store of normalized COVID frames, one per CSV file.
+
+    get() parses (through the binary cache) and normalizes a file the first
+    time it is asked for, then hands every caller a copy of that same frame:
+    shallow under copy-on-write, deep otherwise, so one caller's edits never
+    reach another. Filled and unfilled counts are kept as separate entries.
+    Reloads happen only when the file's size or mtime changes.
+    """
+
+    def __init__(self):
+        self._frames = {}
+        self._lock = threading.Lock()
+
+    def get(self, csv_path, fill_counts: bool = False) -> pd.DataFrame:
+        path = Path(csv_path).resolve()
+        stat = path.stat()
+        signature = (stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            entry = self._frames.get((path, fill_counts))
+            if entry is None or entry[0] != signature:
+                frame = normalize_covid_frame(read_csv_cached(path), fill_counts=fill_counts)
+                entry = self._frames[(path, fill_counts)] = (signature, frame)
+        return entry[1].copy(deep=not copy_on_write())
+
+    def clear(self):
+        with self._lock:
+            self._frames.clear()
+
+
+registry = DatasetRegistry()
+
+
+def load_covid_frame(csv_path, fill_counts: bool = False) -> pd.DataFrame:
+    """Normalized frame for csv_path, shared with every other module in this process."""
+    return registry.get(csv_path, fill_counts)
@@ -0,0 +1,147 @@
+# frame_cache.py
+# Transparent binary cache for parsed CSV files.
+#
+# Usage:
+#   df = read_csv_cached("country_wise_latest.csv")
+#
+# Notes:
+# - The first load parses the CSV as usual and stores every column as an
+#   uncompressed .npy file (strings as category codes + categories) in a
+#   ".frame_cache" folder next to the CSV.
+# - Later loads memory-map those arrays instead of parsing text.
+# - An entry is reused while the file's size and mtime match; if only the
+#   mtime changed, the content hash decides (e.g. after a fresh checkout).
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR_NAME = ".frame_cache"
+FORMAT_VERSION = 1
+
+
+def file_digest(path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha1").hexdigest()
+
+
+def _entry_dir(csv_path: Path, options: dict, cache_dir) -> Path:
+    root = Path(cache_dir) if cache_dir is not None else csv_path.parent / CACHE_DIR_NAME
+    key = hashlib.sha1(f"{csv_path}|{sorted(options.items())!r}".encode()).hexdigest()[:16]
+    return root / f"{csv_path.stem}-{key}"
+
+
+def _is_fresh(meta: dict, csv_path: Path, stat: os.stat_result) -> bool:
+    if meta.get("version") != FORMAT_VERSION or meta.get("size") != stat.st_size:
+        return False
+    if meta.get("mtime_ns") == stat.st_mtime_ns:
+        return True
+    return meta.get("sha1") == file_digest(csv_path)
+
+
+def _column_kind(series: pd.Series):
+    """How a column is stored: "array" (.npy as is), "category" (codes + labels) or None."""
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "biufcmM":
+        return "array"
+    if isinstance(dtype, pd.CategoricalDtype):
+        values = dtype.categories
+    elif dtype == object or pd.api.types.is_string_dtype(dtype):
+        values = series
+    else:
+        return None
+    return "category" if pd.api.types.infer_dtype(values, skipna=True) in ("string", "empty") else None
+
+
+def _cacheable(df: pd.DataFrame) -> bool:
+    index = df.index
+    return (isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1
+            and df.columns.is_unique
+            and all(isinstance(col, str) for col in df.columns)
+            and all(_column_kind(df[col]) is not None for col in df.columns))
+
+
+def _write(entry: Path, df: pd.DataFrame, csv_path: Path, stat: os.stat_result, options: dict):
+    if entry.exists():
+        shutil.rmtree(entry)
+    entry.mkdir(parents=True)
+    columns = []
+    for i, name in enumerate(df.columns):
+        series = df[name]
+        kind = _column_kind(series)
+        if kind == "category":
+            # Strings become int codes + one array of distinct labels
+            cat = series if isinstance(series.dtype, pd.CategoricalDtype) else series.astype("category")
+            np.save(entry / f"{i}.npy", cat.cat.codes.to_numpy())
+            np.save(entry / f"{i}.categories.npy", np.asarray(cat.cat.categories, dtype=str))
+        else:
+            np.save(entry / f"{i}.npy", series.to_numpy())
+        columns.append({"name": name, "kind": kind, "dtype": str(series.dtype)})
+
+    meta = {
+        "version": FORMAT_VERSION,
+        "source": str(csv_path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha1": file_digest(csv_path),
+        "options": repr(sorted(options.items())),
+        "rows": len(df),
+        "columns": columns,
+    }
+    # meta.json is written last: an entry without it is incomplete and ignored
+    (entry / "meta.json").write_text(json.dumps(meta, indent=1))
+
+
+def _read(entry: Path, meta: dict) -> pd.DataFrame:
+    data = {}
+    for i, col in enumerate(meta["columns"]):
+        # mmap_mode="c": pages are shared with the file and stay writable,
+        # but edits only change this process's copy, never the cache
+        values = np.load(entry / f"{i}.npy", mmap_mode="c")
+        if col["kind"] == "category":
+            categories = np.load(entry / f"{i}.categories.npy")
+            series = pd.Series(pd.Categorical.from_codes(values, categories), name=col["name"])
+            if col["dtype"] != "category":
+                series = series.astype(pd.api.types.pandas_dtype(col["dtype"]))
+            data[col["name"]] = series
+        else:
+            data[col["name"]] = values
+    return pd.DataFrame(data, copy=False)
+
+
+def read_csv_cached(csv_path, cache_dir=None, **read_csv_options) -> pd.DataFrame:
+    """pd.read_csv with a binary columnar cache keyed by path, options, size, mtime and hash."""
+    csv_path = Path(csv_path).resolve()
+    stat = csv_path.stat()
+    entry = _entry_dir(csv_path, read_csv_options, cache_dir)
+    meta_path = entry / "meta.json"
+
+    if meta_path.exists():
+        meta = json.loads(meta_path.read_text())
+        if _is_fresh(meta, csv_path, stat):
+            if meta["mtime_ns"] != stat.st_mtime_ns:
+                meta["mtime_ns"] = stat.st_mtime_ns
+                meta_path.write_text(json.dumps(meta, indent=1))
+            return _read(entry, meta)
+
+    df = pd.read_csv(csv_path, **read_csv_options)
+    if "chunksize" in read_csv_options or "iterator" in read_csv_options:
+        return df
+    if _cacheable(df):
+        try:
+            _write(entry, df, csv_path, stat, read_csv_options)
+        except OSError:
+            pass  # a read-only location just means no cache
+    return df
+
+
+def clear_cache(csv_path, cache_dir=None):
+    root = Path(cache_dir) if cache_dir is not None else Path(csv_path).resolve().parent / CACHE_DIR_NAME
+    stem = Path(csv_path).stem
+    for entry in root.glob(f"{stem}-*"):
+        shutil.rmtree(entry, ignore_errors=True)
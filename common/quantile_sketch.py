@@ -0,0 +1,106 @@
+# quantile_sketch.py
+# Mergeable streaming quantile sketch (KLL) shared by the weekly assignments.
+#
+# Usage:
+#   sketch = KLLSketch()
+#   sketch.update(execution_times)      # feed batches as they arrive
+#   sketch.quantiles([0.5, 0.95, 0.99]) # p50 / p95 / p99
+#   sketch.merge(sketch_from_worker)    # combine sketches built elsewhere
+
+import math
+
+import numpy as np
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch (Karnin, Lang & Liberty, 2016).
+
+    Keeps a stack of compactors; an item at level h stands for 2**h original
+    values. When a level is full it is sorted and every other item (random
+    offset) is promoted to the level above, so memory stays O(k) no matter
+    how many values are fed in. Rank error is roughly 1.7 / k (about 1% for
+    the default k=200); until the first compaction the answers are exact and
+    match np.percentile's linear interpolation.
+    """
+
+    def __init__(self, k: int = 200, seed=None):
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k = k
+        self.n = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self):
+        return self.n
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - level - 1
+        return max(2, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def update(self, values):
+        """Add one value or a batch (any array-like) to the sketch."""
+        values = np.asarray(values, dtype=float).ravel()
+        if values.size == 0:
+            return
+        self.n += values.size
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+
+    def _compress(self):
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if items.size >= self._capacity(level):
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item out stays behind so total weight is preserved
+                keep = items[-1:] if items.size % 2 else items[:0]
+                pairs = items[:items.size - keep.size]
+                promoted = pairs[self._rng.integers(2)::2]
+                self._levels[level] = keep
+                self._levels[level + 1] = np.concatenate([self._levels[level + 1], promoted])
+            level += 1
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """Fold another sketch (e.g. from a different worker) into this one."""
+        if other.k != self.k:
+            raise ValueError(f"Cannot merge sketches with k={self.k} and k={other.k}")
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for level, items in enumerate(other._levels):
+            self._levels[level] = np.concatenate([self._levels[level], items])
+        self.n += other.n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    def quantiles(self, qs):
+        """Approximate quantiles for qs in [0, 1] (array-like)."""
+        qs = np.asarray(qs, dtype=float)
+        if self.n == 0:
+            return np.full(qs.shape, np.nan)
+        values = np.concatenate(self._levels)
+        weights = np.concatenate([np.full(items.size, 2.0 ** level)
+                                  for level, items in enumerate(self._levels)])
+        order = np.argsort(values, kind="stable")
+        values, weights = values[order], weights[order]
+        # Each item covers a block of `weight` ranks; place it at the block
+        # centre and interpolate between items like np.percentile does
+        ranks = np.cumsum(weights) - (weights + 1) / 2
+        result = np.interp(qs * (self.n - 1), ranks, values)
+        return np.clip(result, self.min, self.max)
+
+    def quantile(self, q: float) -> float:
+        return float(self.quantiles(q))
+
+    def percentile(self, p: float) -> float:
+        """Same scale as np.percentile (p in 0..100)."""
+        return self.quantile(p / 100)